@@ -13,96 +13,120 @@ _warnings.filterwarnings("ignore", message=".*urllib3.*OpenSSL.*")
 
 __version__ = "1.0.0"
 
-from .apps import get_bundle_id, launch_app, list_apps, load_apps_config, sync_apps_config
-from .config import (
-    APPS_CONFIG_FILE,
-    CREDENTIALS_FILE,
-    SCENARIOS_FILE,
-    SCHEDULE_FILE,
-    logger,
-    setup_logging,
-)
-from .connection import (
-    connect_atv,
-    pair_device,
-    scan_devices,
-    select_device,
-)
-from .controls import (
-    RemoteButton,
-    cmd_next,
-    cmd_pause,
-    cmd_play,
-    cmd_play_pause,
-    cmd_previous,
-    cmd_stop,
-    get_power_status,
-    get_volume,
-    press_button,
-    set_volume,
-    turn_off,
-    turn_on,
-    volume_down,
-    volume_up,
-)
-from .exceptions import AppleTVError, DeviceNotFoundError, FeatureNotAvailableError
-from .models import DEFAULT_ACTION_DELAY, ValidationError, validate_scenarios, validate_schedules
-from .scenarios import load_scenarios, run_scenario
-from .scheduler import ScheduleEntry, load_schedules, run_scheduler, save_schedules
-from .server import run_server
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
+if TYPE_CHECKING:
+    from .apps import get_bundle_id, launch_app, list_apps, load_apps_config, sync_apps_config
+    from .config import (
+        APPS_CONFIG_FILE,
+        CREDENTIALS_FILE,
+        SCENARIOS_FILE,
+        SCHEDULE_FILE,
+        logger,
+        setup_logging,
+    )
+    from .connection import (
+        connect_atv,
+        pair_device,
+        scan_devices,
+        select_device,
+    )
+    from .controls import (
+        RemoteButton,
+        cmd_next,
+        cmd_pause,
+        cmd_play,
+        cmd_play_pause,
+        cmd_previous,
+        cmd_stop,
+        get_power_status,
+        get_volume,
+        press_button,
+        set_volume,
+        turn_off,
+        turn_on,
+        volume_down,
+        volume_up,
+    )
+    from .exceptions import AppleTVError, DeviceNotFoundError, FeatureNotAvailableError
+    from .models import DEFAULT_ACTION_DELAY, ValidationError, validate_scenarios, validate_schedules
+    from .scenarios import load_scenarios, load_validated_scenarios, run_scenario
+    from .scheduler import ScheduleEntry, load_schedules, run_scheduler, save_schedules
+    from .server import run_server
+
+# Nom exporte -> sous-module. Les sous-modules sont importes au premier acces
+# (PEP 562) : les commandes purement locales (apps.json, scenarios.json)
+# n'ont pas a charger pyatv et aiohttp.
+_EXPORTS = {
     # Config
-    "APPS_CONFIG_FILE",
-    "CREDENTIALS_FILE",
-    "SCENARIOS_FILE",
-    "SCHEDULE_FILE",
-    "logger",
-    "setup_logging",
+    "APPS_CONFIG_FILE": "config",
+    "CREDENTIALS_FILE": "config",
+    "SCENARIOS_FILE": "config",
+    "SCHEDULE_FILE": "config",
+    "logger": "config",
+    "setup_logging": "config",
     # Exceptions
-    "AppleTVError",
-    "DeviceNotFoundError",
-    "FeatureNotAvailableError",
-    "ValidationError",
+    "AppleTVError": "exceptions",
+    "DeviceNotFoundError": "exceptions",
+    "FeatureNotAvailableError": "exceptions",
+    "ValidationError": "models",
     # Validation
-    "DEFAULT_ACTION_DELAY",
-    "validate_scenarios",
-    "validate_schedules",
+    "DEFAULT_ACTION_DELAY": "models",
+    "validate_scenarios": "models",
+    "validate_schedules": "models",
     # Connection
-    "connect_atv",
-    "pair_device",
-    "scan_devices",
-    "select_device",
+    "connect_atv": "connection",
+    "pair_device": "connection",
+    "scan_devices": "connection",
+    "select_device": "connection",
     # Controls
-    "RemoteButton",
-    "cmd_next",
-    "cmd_pause",
-    "cmd_play",
-    "cmd_play_pause",
-    "cmd_previous",
-    "cmd_stop",
-    "get_power_status",
-    "get_volume",
-    "press_button",
-    "set_volume",
-    "turn_off",
-    "turn_on",
-    "volume_down",
-    "volume_up",
+    "RemoteButton": "controls",
+    "cmd_next": "controls",
+    "cmd_pause": "controls",
+    "cmd_play": "controls",
+    "cmd_play_pause": "controls",
+    "cmd_previous": "controls",
+    "cmd_stop": "controls",
+    "get_power_status": "controls",
+    "get_volume": "controls",
+    "press_button": "controls",
+    "set_volume": "controls",
+    "turn_off": "controls",
+    "turn_on": "controls",
+    "volume_down": "controls",
+    "volume_up": "controls",
     # Apps
-    "get_bundle_id",
-    "launch_app",
-    "list_apps",
-    "load_apps_config",
-    "sync_apps_config",
+    "get_bundle_id": "apps",
+    "launch_app": "apps",
+    "list_apps": "apps",
+    "load_apps_config": "apps",
+    "sync_apps_config": "apps",
     # Scenarios
-    "load_scenarios",
-    "run_scenario",
+    "load_scenarios": "scenarios",
+    "load_validated_scenarios": "scenarios",
+    "run_scenario": "scenarios",
     # Scheduler
-    "ScheduleEntry",
-    "load_schedules",
-    "run_scheduler",
-    "save_schedules",
+    "ScheduleEntry": "scheduler",
+    "load_schedules": "scheduler",
+    "run_scheduler": "scheduler",
+    "save_schedules": "scheduler",
     # Server
-    "run_server",
-]
+    "run_server": "server",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Importe le sous-module d'un nom exporte au premier acces."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,52 +2,116 @@
 
 from __future__ import annotations
 
+import time
+import weakref
+from operator import itemgetter
 from typing import Any
 
 from pyatv.const import FeatureName
 from pyatv.interface import AppleTV
 
 from .config import (
+    APP_LIST_TTL,
     APPS_CONFIG_FILE,
     DEFAULT_APPS_CONFIG,
     load_json,
     logger,
-    save_json,
+    save_json_async,
 )
 from .connection import require_feature
 
 
+class _AliasTable(dict):
+    """Table str.translate des alias, completee a la demande.
+
+    Espaces/tirets -> "_", lettres, chiffres et "_" conserves (Unicode
+    compris), tout le reste supprime. Chaque caractere n'est classe qu'une
+    fois par processus.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char == "_" else None
+        self[codepoint] = value
+        return value
+
+
+_ALIAS_TABLE = _AliasTable({ord(" "): "_", ord("-"): "_"})
+
+
+def _make_alias(app_name: str) -> str:
+    """Construit un alias a partir du nom d'une application."""
+    return app_name.lower().translate(_ALIAS_TABLE)
+
+
 def load_apps_config() -> dict[str, str]:
     """Charge la configuration des applications."""
     config = load_json(APPS_CONFIG_FILE)
     if not config:
-        save_json(APPS_CONFIG_FILE, DEFAULT_APPS_CONFIG)
+        # Pas d'ecriture ici : apps.json est cree a la premiere sauvegarde
         return DEFAULT_APPS_CONFIG.copy()
     return config
 
 
-def get_bundle_id(app_name: str) -> str:
-    """Retourne le bundle ID pour un alias ou le nom lui-meme."""
-    config = load_apps_config()
+# Applications installees, memorisees par connexion : (date monotone, liste).
+# Duree limitee a APP_LIST_TTL : une connexion gardee ouverte (daemon,
+# scheduler) voit les applications installees ou supprimees entre-temps.
+_app_lists: weakref.WeakKeyDictionary[AppleTV, tuple[float, list[Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _get_app_list(atv: AppleTV) -> list[Any]:
+    """Retourne la liste des applications (reutilisee pendant APP_LIST_TTL)."""
+    cached = _app_lists.get(atv)
+    if cached is not None and time.monotonic() - cached[0] < APP_LIST_TTL:
+        return cached[1]
+
+    apps = await atv.apps.app_list()
+    _app_lists[atv] = (time.monotonic(), apps)
+    return apps
+
+
+def clear_app_list(atv: AppleTV) -> None:
+    """Oublie la liste des applications memorisee pour une connexion."""
+    _app_lists.pop(atv, None)
+
+
+def get_bundle_id(app_name: str, apps_config: dict[str, str] | None = None) -> str:
+    """Retourne le bundle ID pour un alias ou le nom lui-meme.
+
+    Args:
+        app_name: Alias ou bundle ID.
+        apps_config: Configuration deja chargee (evite une relecture).
+    """
+    config = apps_config if apps_config is not None else load_apps_config()
     return config.get(app_name.lower(), app_name)
 
 
 @require_feature(FeatureName.AppList)
 async def list_apps(atv: AppleTV) -> list[Any]:
     """Liste les applications installees."""
-    apps = await atv.apps.app_list()
-    logger.info("\nApplications installees:\n")
-    for app in sorted(apps, key=lambda a: a.name.lower()):
-        logger.info(f"  {app.name}")
-        logger.info(f"    {app.identifier}\n")
-    logger.info(f"Total: {len(apps)} applications")
+    apps = list(await _get_app_list(atv))
+
+    # Cle de tri calculee une seule fois par application
+    decorated = [(app.name.casefold(), app) for app in apps]
+    decorated.sort(key=itemgetter(0))
+
+    lines = ["\nApplications installees:\n"]
+    for _, app in decorated:
+        lines.append(f"  {app.name}")
+        lines.append(f"    {app.identifier}\n")
+    lines.append(f"Total: {len(apps)} applications")
+    logger.info("\n".join(lines))
     return apps
 
 
 @require_feature(FeatureName.LaunchApp)
-async def launch_app(atv: AppleTV, app_name: str) -> None:
+async def launch_app(
+    atv: AppleTV, app_name: str, apps_config: dict[str, str] | None = None
+) -> None:
     """Lance une application par alias ou bundle ID."""
-    bundle_id = get_bundle_id(app_name)
+    bundle_id = get_bundle_id(app_name, apps_config)
     logger.info(f"Lancement de {app_name} ({bundle_id})...")
     await atv.apps.launch_app(bundle_id)
     logger.info("Application lancee!")
@@ -56,28 +120,34 @@ async def launch_app(atv: AppleTV, app_name: str) -> None:
 @require_feature(FeatureName.AppList)
 async def sync_apps_config(atv: AppleTV) -> int:
     """Synchronise apps.json avec les apps installees."""
-    apps = await atv.apps.app_list()
+    apps = await _get_app_list(atv)
     config = load_apps_config()
     existing_ids = set(config.values())
+    taken_aliases = set(config)
+    # Prochain suffixe a essayer par alias de base
+    next_suffix: dict[str, int] = {}
 
     added = 0
     for app in apps:
         if app.identifier not in existing_ids:
-            alias = app.name.lower().replace(" ", "_").replace("-", "_")
-            alias = "".join(c for c in alias if c.isalnum() or c == "_")
+            alias = _make_alias(app.name)
 
-            # Eviter doublons
-            base = alias
-            counter = 1
-            while alias in config:
-                alias = f"{base}_{counter}"
-                counter += 1
+            # Eviter doublons (sans reprendre a _1 pour chaque collision)
+            if alias in taken_aliases:
+                base = alias
+                counter = next_suffix.get(base, 1)
+                while alias in taken_aliases:
+                    alias = f"{base}_{counter}"
+                    counter += 1
+                next_suffix[base] = counter
 
             config[alias] = app.identifier
+            taken_aliases.add(alias)
+            existing_ids.add(app.identifier)
             added += 1
 
     if added > 0:
-        save_json(APPS_CONFIG_FILE, config)
+        await save_json_async(APPS_CONFIG_FILE, config)
         logger.info(f"{added} application(s) ajoutee(s)")
     else:
         logger.info("apps.json deja a jour")
@@ -88,10 +158,12 @@ async def sync_apps_config(atv: AppleTV) -> int:
 def show_apps_config() -> None:
     """Affiche la configuration des applications."""
     config = load_apps_config()
-    logger.info(f"\nConfiguration des applications ({APPS_CONFIG_FILE}):\n")
+    lines = [f"\nConfiguration des applications ({APPS_CONFIG_FILE}):\n"]
 
     if config:
-        max_len = max(len(a) for a in config)
+        max_len = len(max(config, key=len))
         for alias, bundle_id in sorted(config.items()):
-            logger.info(f"  {alias:<{max_len}}  ->  {bundle_id}")
-        logger.info(f"\n{len(config)} application(s)")
+            lines.append(f"  {alias:<{max_len}}  ->  {bundle_id}")
+        lines.append(f"\n{len(config)} application(s)")
+
+    logger.info("\n".join(lines))
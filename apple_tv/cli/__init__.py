@@ -8,11 +8,12 @@ _warnings.filterwarnings("ignore", message=".*urllib3.*OpenSSL.*")
 
 import typer
 
+from ..config import install_uvloop
 from .commands.config import config_cmd, scan_cmd, setup_cmd, test_cmd
 from .commands.control import apps_cmd, launch_cmd, sleep_cmd, status_cmd, wake_cmd
 from .commands.help import reference_cmd
 from .commands.scenarios import list_cmd, record_cmd, run_cmd
-from .commands.server import server_cmd
+from .commands.server import daemon_cmd, server_cmd
 
 # Application principale
 app = typer.Typer(
@@ -48,12 +49,19 @@ app.command("apps", rich_help_panel="Applications")(apps_cmd)
 
 # Serveur
 app.command("server", rich_help_panel="Serveur")(server_cmd)
+app.command("daemon", rich_help_panel="Serveur")(daemon_cmd)
 
 
 def main():
     """Point d'entree principal."""
+    install_uvloop()
     app()
 
 
+def run():
+    """Point d'entree de apple-tv, apple_tv_power.py et python -m apple_tv."""
+    main()
+
+
 if __name__ == "__main__":
     main()
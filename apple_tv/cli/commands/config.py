@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from typing import Optional
 
-import questionary
 import typer
 
 from ...config import (
@@ -14,7 +13,6 @@ from ...config import (
     load_json,
     set_default_device,
 )
-from ...connection import pair_device, scan_devices
 from ..console import console, create_spinner, create_table, print_error, print_panel, print_success
 from ..constants import QUESTIONARY_STYLE
 from ..utils import require_device, resolve_device_name, run_async
@@ -45,6 +43,8 @@ def config_cmd(
             return
 
     if default_device:
+        from ...connection import scan_devices
+
         devices = run_async(scan_devices())
         device_names = [d.name for d in devices]
 
@@ -64,6 +64,10 @@ def setup_cmd():
 
     Recherche les Apple TV sur le reseau et guide l'appairage.
     """
+    import questionary
+
+    from ...connection import pair_device, scan_devices
+
     console.print()
     print_panel("🍎 Apple TV Controller", "Assistant de configuration")
     console.print()
@@ -140,6 +144,8 @@ def scan_cmd():
     """
     🔍 Rechercher les Apple TV sur le reseau.
     """
+    from ...connection import scan_devices
+
     console.print()
 
     with create_spinner() as progress:
@@ -189,6 +195,7 @@ def test_cmd(
 
 def test_connection_impl(device_name: Optional[str] = None):
     """Implementation du test de connexion."""
+    from ...connection import scan_devices, select_device
     from ..operations import get_power_state
 
     console.print()
@@ -205,7 +212,6 @@ def test_connection_impl(device_name: Optional[str] = None):
     if not resolved_name:
         raise typer.Exit(0)
 
-    from ...connection import select_device
     device = select_device(devices, resolved_name)
 
     console.print(f"Test de connexion a [cyan]{device.name}[/cyan]...")
@@ -6,12 +6,9 @@ from typing import Optional
 
 import typer
 
-from ...apps import list_apps as _list_apps, sync_apps_config
 from ...config import setup_logging
-from ...connection import connect_atv
 from ..console import console, create_spinner, print_error, print_panel, print_success
-from ..operations import get_device_status, launch_app, sleep_device, wake_device
-from ..utils import require_device, run_async
+from ..utils import forward_to_daemon, require_device, run_async
 
 router = typer.Typer()
 
@@ -23,11 +20,20 @@ def wake_cmd(
         help="Nom de l'Apple TV",
         envvar="ATV_DEVICE",
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="Ignorer les appareils memorises (scan complet du reseau)",
+    ),
 ):
     """
     🔆 Allumer l'Apple TV.
     """
-    with require_device(device) as selected:
+    if forward_to_daemon("on", {}, device):
+        return
+
+    from ..operations import wake_device
+
+    with require_device(device, refresh=refresh) as selected:
         try:
             run_async(wake_device(selected))
             print_success(f"{selected.name} allumee")
@@ -43,11 +49,20 @@ def sleep_cmd(
         help="Nom de l'Apple TV",
         envvar="ATV_DEVICE",
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="Ignorer les appareils memorises (scan complet du reseau)",
+    ),
 ):
     """
     🌙 Eteindre l'Apple TV (veille).
     """
-    with require_device(device) as selected:
+    if forward_to_daemon("off", {}, device):
+        return
+
+    from ..operations import sleep_device
+
+    with require_device(device, refresh=refresh) as selected:
         try:
             run_async(sleep_device(selected))
             print_success(f"{selected.name} en veille")
@@ -64,11 +79,20 @@ def launch_cmd(
         help="Nom de l'Apple TV",
         envvar="ATV_DEVICE",
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="Ignorer les appareils memorises (scan complet du reseau)",
+    ),
 ):
     """
     🚀 Lancer une application.
     """
-    with require_device(device) as selected:
+    if forward_to_daemon("launch", {"app": app_name}, device):
+        return
+
+    from ..operations import launch_app
+
+    with require_device(device, refresh=refresh) as selected:
         try:
             run_async(launch_app(selected, app_name))
             print_success(f"{app_name} lance sur {selected.name}")
@@ -84,11 +108,17 @@ def status_cmd(
         help="Nom de l'Apple TV",
         envvar="ATV_DEVICE",
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="Ignorer les appareils memorises (scan complet du reseau)",
+    ),
 ):
     """
     📊 Afficher l'etat de l'Apple TV.
     """
-    with require_device(device) as selected:
+    from ..operations import get_device_status
+
+    with require_device(device, refresh=refresh) as selected:
         try:
             with create_spinner() as progress:
                 progress.add_task("Connexion...", total=None)
@@ -129,14 +159,24 @@ def apps_cmd(
         help="Nom de l'Apple TV",
         envvar="ATV_DEVICE",
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="Ignorer les appareils memorises (scan complet du reseau)",
+    ),
     sync: bool = typer.Option(False, "--sync", help="Synchroniser apps.json"),
 ):
     """
     📱 Lister les applications installees.
     """
+    if forward_to_daemon("apps_sync" if sync else "apps", {}, device):
+        return
+
+    from ...apps import list_apps as _list_apps, sync_apps_config
+    from ...connection import connect_atv
+
     setup_logging()
 
-    with require_device(device) as selected:
+    with require_device(device, refresh=refresh) as selected:
         try:
             async def get_apps():
                 async with connect_atv(selected) as atv:
@@ -70,6 +70,9 @@ def reference_cmd():
     param_table.add_column("Defaut", style="dim")
     param_table.add_row("delay", "Pause apres l'action (secondes)", "0.5")
     param_table.add_row("repeat", "Nombre de repetitions", "1")
+    param_table.add_row("inter_delay", "Pause entre repetitions (secondes)", "delay")
+    param_table.add_row("burst", "Envoyer les repetitions en rafale", "false")
+    param_table.add_row("pipeline", "Enchainer les repetitions sans attendre", "fleches")
     param_table.add_row("app", "Nom ou bundle ID de l'app", "-")
     param_table.add_row("seconds", "Duree de pause pour wait", "-")
     param_table.add_row("name", "Nom du sous-scenario", "-")
@@ -6,17 +6,14 @@ import asyncio
 import json
 from typing import Optional
 
-import questionary
 import typer
+from rich.console import Group
+from rich.table import Table
 
-from ...apps import launch_app as _launch_app, load_apps_config
 from ...config import SCENARIOS_FILE, save_json
-from ...connection import connect_atv
-from ...scenarios import load_scenarios
 from ..console import console, create_table, print_error, print_panel, print_success, print_warning
 from ..constants import QUESTIONARY_STYLE, SWIPE_GESTURES
-from ..operations import execute_remote_action, run_scenario
-from ..utils import require_device, run_async
+from ..utils import forward_to_daemon, require_device, run_async
 
 router = typer.Typer()
 
@@ -29,12 +26,20 @@ def run_cmd(
         help="Nom de l'Apple TV",
         envvar="ATV_DEVICE",
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="Ignorer les appareils memorises (scan complet du reseau)",
+    ),
 ):
     """
     ▶️  Executer un scenario.
 
     Sans argument, affiche une liste interactive des scenarios.
     """
+    import questionary
+
+    from ...scenarios import load_scenarios
+
     # Charger les scenarios
     try:
         scenarios = load_scenarios()
@@ -49,9 +54,7 @@ def run_cmd(
 
     # Selection interactive du scenario si non specifie
     if not scenario_name:
-        console.print()
-        _print_scenarios_table(scenarios)
-        console.print()
+        console.print(Group("", _scenarios_table(scenarios), ""))
 
         scenario_name = questionary.select(
             "Quel scenario executer ?",
@@ -66,7 +69,13 @@ def run_cmd(
         print_error(f"Scenario '{scenario_name}' non trouve")
         raise typer.Exit(1)
 
-    with require_device(device) as selected:
+    if forward_to_daemon("scenario", {"name": scenario_name}, device):
+        print_success("Scenario termine avec succes")
+        return
+
+    from ..operations import run_scenario
+
+    with require_device(device, refresh=refresh) as selected:
         console.print()
         console.print(f"[bold]▶ Execution de [cyan]{scenario_name}[/cyan] sur [cyan]{selected.name}[/cyan][/bold]")
         console.print("[dim]Ctrl+C pour interrompre[/dim]")
@@ -95,6 +104,8 @@ def list_cmd():
     """
     📋 Lister les scenarios disponibles.
     """
+    from ...scenarios import load_scenarios
+
     try:
         scenarios = load_scenarios()
     except Exception as e:
@@ -105,9 +116,10 @@ def list_cmd():
         print_warning("Aucun scenario configure.")
         raise typer.Exit(0)
 
-    console.print()
-    _print_scenarios_table(scenarios)
-    console.print(f"\n[dim]Fichier: {SCENARIOS_FILE}[/dim]")
+    # Une seule ecriture pour toute la liste
+    console.print(
+        Group("", _scenarios_table(scenarios), f"\n[dim]Fichier: {SCENARIOS_FILE}[/dim]")
+    )
 
 
 @router.command("record")
@@ -118,11 +130,20 @@ def record_cmd(
         help="Nom de l'Apple TV",
         envvar="ATV_DEVICE",
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="Ignorer les appareils memorises (scan complet du reseau)",
+    ),
 ):
     """
     🎬 Enregistrer un nouveau scenario interactivement.
     """
-    with require_device(device) as selected:
+    import questionary
+
+    from ...apps import load_apps_config
+    from ...scenarios import load_scenarios
+
+    with require_device(device, refresh=refresh) as selected:
         console.print()
         print_panel(f"🎬 Enregistrement: {name}", f"Device: {selected.name}")
         console.print()
@@ -181,13 +202,13 @@ def record_cmd(
             console.print(json.dumps(scenario_json, indent=2, ensure_ascii=False))
 
 
-def _print_scenarios_table(scenarios: dict) -> None:
-    """Affiche le tableau des scenarios."""
+def _scenarios_table(scenarios: dict) -> Table:
+    """Construit le tableau des scenarios."""
     rows = [
         [name, data.get("description", "-"), str(len(data.get("steps", [])))]
         for name, data in scenarios.items()
     ]
-    table = create_table(
+    return create_table(
         "Scenarios disponibles",
         [
             ("Nom", {"style": "cyan"}),
@@ -196,11 +217,16 @@ def _print_scenarios_table(scenarios: dict) -> None:
         ],
         rows,
     )
-    console.print(table)
 
 
 async def _record_session(selected, steps: list, apps_config: dict) -> bool:
     """Session d'enregistrement interactive."""
+    import questionary
+
+    from ...apps import launch_app as _launch_app
+    from ...connection import connect_atv
+    from ..operations import execute_remote_action
+
     actions_menu = {
         "⬆️  Haut (up)": "up",
         "⬇️  Bas (down)": "down",
@@ -287,6 +313,8 @@ async def _record_session(selected, steps: list, apps_config: dict) -> bool:
 
 async def _select_app(apps_config: dict) -> Optional[str]:
     """Selection interactive d'une application."""
+    import questionary
+
     app_choices = list(apps_config.keys()) + ["[Autre - entrer manuellement]"]
     app_choice = await questionary.select(
         "Quelle application ?",
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+from typing import Optional
 
 import typer
 
-from ..console import console, print_panel, print_warning
-from ..utils import run_async
+from ...config import setup_logging
+from ..console import console, print_error, print_panel, print_warning
+from ..utils import require_device, run_async
 
 router = typer.Typer()
 
@@ -28,6 +30,7 @@ def server_cmd(
     console.print("  [cyan]GET[/cyan]  /health")
     console.print("  [cyan]GET[/cyan]  /scenarios")
     console.print("  [cyan]POST[/cyan] /scenario/{name}?device=Salon")
+    console.print("  [cyan]POST[/cyan] /schedule")
     console.print("  [cyan]POST[/cyan] /shutdown")
     console.print()
     console.print("[dim]Ctrl+C pour arreter[/dim]")
@@ -38,3 +41,35 @@ def server_cmd(
     except (KeyboardInterrupt, asyncio.CancelledError):
         print_warning("Serveur arrete")
         raise typer.Exit(0)
+
+
+@router.command("daemon")
+def daemon_cmd(
+    device: Optional[str] = typer.Option(
+        None, "-d", "--device",
+        help="Nom de l'Apple TV",
+        envvar="ATV_DEVICE",
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="Ignorer les appareils memorises (scan complet du reseau)",
+    ),
+):
+    """
+    🔌 Garder la connexion ouverte pour les commandes suivantes.
+
+    Les commandes lancees sans -d sont transmises au daemon.
+    """
+    from ...daemon import run_daemon
+
+    setup_logging()
+
+    with require_device(device, refresh=refresh) as selected:
+        try:
+            run_async(run_daemon(selected))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            print_warning("Daemon arrete")
+            raise typer.Exit(0)
+        except Exception as e:
+            print_error(f"Erreur: {e}")
+            raise typer.Exit(1)
@@ -4,14 +4,12 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Generator, Optional
+from typing import TYPE_CHECKING, Any, Generator, Optional
 
-import questionary
 import typer
 
-from ..config import get_default_device
-from ..connection import scan_devices, select_device
-from .console import console
+from ..config import DAEMON_SOCKET, enable_eager_tasks, get_default_device
+from .console import console, print_error
 
 if TYPE_CHECKING:
     from pyatv.conf import AppleTV
@@ -25,11 +23,17 @@ def run_async(coro):
         loop = None
 
     if loop is None:
-        return asyncio.run(coro)
+        return asyncio.run(_eager(coro))
     else:
         return loop.run_until_complete(coro)
 
 
+async def _eager(coro):
+    """Execute la coroutine avec les taches eager actives (voir enable_eager_tasks)."""
+    enable_eager_tasks()
+    return await coro
+
+
 def resolve_device_name(device: Optional[str], devices: list["AppleTV"]) -> Optional[str]:
     """Resout le nom du device a utiliser.
 
@@ -56,6 +60,8 @@ def resolve_device_name(device: Optional[str], devices: list["AppleTV"]) -> Opti
     if len(devices) == 1:
         return devices[0].name
 
+    import questionary
+
     device_choices = [d.name for d in devices]
     choice = questionary.select(
         "Quelle Apple TV ?",
@@ -67,6 +73,7 @@ def resolve_device_name(device: Optional[str], devices: list["AppleTV"]) -> Opti
 @contextmanager
 def require_device(
     device: Optional[str] = None,
+    refresh: bool = False,
 ) -> Generator["AppleTV", None, None]:
     """Context manager pour obtenir un device.
 
@@ -75,6 +82,7 @@ def require_device(
 
     Args:
         device: Nom du device (optionnel)
+        refresh: Ignorer les appareils memorises (scan complet)
 
     Yields:
         Le device AppleTV selectionne
@@ -83,7 +91,10 @@ def require_device(
         with require_device(device_name) as selected:
             # utiliser selected
     """
-    devices = run_async(scan_devices())
+    from ..connection import remember_device, select_device
+    from ..exceptions import DeviceNotFoundError
+
+    devices = run_async(_find_devices(device, refresh))
 
     if not devices:
         console.print("[red]✗[/red] Aucune Apple TV trouvee")
@@ -93,4 +104,86 @@ def require_device(
     if not resolved_name:
         raise typer.Exit(0)
 
-    yield select_device(devices, resolved_name)
+    try:
+        selected = select_device(devices, resolved_name)
+    except DeviceNotFoundError as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise typer.Exit(1)
+
+    # Prochaine commande : scan unicast de cet appareil
+    remember_device(selected)
+    yield selected
+
+
+async def _find_devices(device: Optional[str], refresh: bool = False) -> list["AppleTV"]:
+    """Recherche les appareils candidats.
+
+    credentials.json est lu dans un thread pendant le scan : la connexion
+    qui suit le retrouve dans le cache de load_json.
+    """
+    from ..connection import load_credentials
+
+    devices, _ = await asyncio.gather(
+        _scan_candidates(device, refresh), asyncio.to_thread(load_credentials)
+    )
+    return devices
+
+
+async def _scan_candidates(device: Optional[str], refresh: bool) -> list["AppleTV"]:
+    """Scanne les appareils candidats.
+
+    Un appareil designe par son adresse IP ou son identifiant est scanne
+    directement. Un nom deja utilise est cherche par scan unicast a ses
+    adresses memorisees ; sans nom (ni device par defaut), c'est le dernier
+    appareil utilise. Le scan complet du reseau n'est fait que si ces
+    appareils ne repondent pas, ou avec refresh.
+    """
+    from ..connection import (
+        is_direct_selector,
+        scan_devices,
+        scan_known_devices,
+        scan_last_device,
+        scan_targeted,
+    )
+
+    name = device or get_default_device()
+    if refresh:
+        devices = []
+    elif name is None:
+        devices = await scan_last_device()
+    elif is_direct_selector(name):
+        devices = await scan_targeted(name)
+    else:
+        devices = await scan_known_devices(name)
+    if devices:
+        return devices
+
+    return await scan_devices(name=name)
+
+
+def forward_to_daemon(command: str, params: dict[str, Any], device: Optional[str]) -> bool:
+    """Transmet la commande au daemon (atv daemon) s'il tourne.
+
+    Seules les commandes sans -d sont transmises : le daemon garde la
+    connexion de l'appareil choisi a son lancement.
+
+    Returns:
+        True si le daemon a execute la commande, False sinon.
+    """
+    # Pas de socket : inutile d'importer le daemon (et pyatv)
+    if device or not DAEMON_SOCKET.exists():
+        return False
+
+    from ..daemon import send_command
+
+    response = run_async(send_command(command, params))
+    if response is None:
+        return False
+
+    output = response.get("output")
+    if output:
+        console.print("\n".join(output), markup=False, highlight=False)
+    if not response.get("ok"):
+        print_error(f"Erreur: {response.get('error')}")
+        raise typer.Exit(1)
+    return True
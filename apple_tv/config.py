@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
 import json
 import logging
 import os
 import tempfile
-import shutil
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Dependance optionnelle (pip install .[fast])
+    orjson = None
+
 # Repertoire du package
 PACKAGE_DIR = Path(__file__).parent.absolute()
 # Repertoire racine (parent du package)
@@ -21,15 +29,24 @@ APPS_CONFIG_FILE = ROOT_DIR / "apps.json"
 SCENARIOS_FILE = ROOT_DIR / "scenarios.json"
 SCHEDULE_FILE = ROOT_DIR / "schedule.json"
 CONFIG_FILE = ROOT_DIR / "config.json"
+LAST_DEVICE_FILE = ROOT_DIR / "last_device.json"
+KNOWN_DEVICES_FILE = ROOT_DIR / "devices.json"  # Appareils deja utilises (nom, adresse)
+
+# Socket du daemon (chemin court : limite de ~100 caracteres des sockets Unix)
+DAEMON_SOCKET = Path(tempfile.gettempdir()) / f"apple_tv-{os.getenv('USER', 'user')}.sock"
 
 # Fichiers sensibles (permissions 600)
 SENSITIVE_FILES = {CREDENTIALS_FILE}
 
 # Timeouts (secondes)
 SCAN_TIMEOUT = 5
+CACHED_SCAN_TIMEOUT = 1  # Scan unicast d'un appareil deja utilise
 OPERATION_TIMEOUT = 10
 REPEAT_DELAY = 0.3  # Delai entre repetitions d'actions
+PIPELINE_MIN_SPACING = 0.05  # Ecart minimal entre deux appuis pipelines
 SCHEDULER_INTERVAL = 60  # Intervalle de verification du scheduler
+SCHEDULER_SCAN_TTL = 15  # Duree de reutilisation d'un scan par le scheduler
+APP_LIST_TTL = 30  # Duree de reutilisation de la liste des apps d'une connexion
 
 # Port serveur HTTP
 SERVER_PORT = 8888
@@ -88,6 +105,39 @@ def setup_logging(level: int = logging.INFO) -> None:
     logger.setLevel(level)
 
 
+def install_uvloop() -> bool:
+    """Utilise uvloop comme boucle asyncio s'il est installe (pip install .[fast]).
+
+    Returns:
+        True si uvloop est actif, False sinon (boucle standard).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def enable_eager_tasks() -> bool:
+    """Active les taches "eager" sur la boucle courante (Python 3.12+).
+
+    Une tache eager s'execute immediatement jusqu'a sa premiere suspension :
+    les coroutines courtes (gather, create_task) ne passent plus par la file
+    de la boucle. A appeler au debut de la coroutine principale.
+
+    Returns:
+        True si active, False si la version de Python ne le permet pas.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return False
+
+    asyncio.get_running_loop().set_task_factory(factory)
+    return True
+
+
 def get_config() -> dict[str, Any]:
     """Charge la configuration utilisateur."""
     return load_json(CONFIG_FILE, default={})
@@ -111,9 +161,60 @@ def set_default_device(device_name: str) -> bool:
     return save_config(config)
 
 
+def _json_loads(raw: bytes) -> Any:
+    """Decode du JSON (orjson si disponible)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode en JSON indente UTF-8 (orjson si disponible)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Cache des fichiers JSON : chemin -> ((mtime_ns, taille), contenu, empreinte)
+_json_cache: dict[Path, tuple[tuple[int, int], Any, bytes]] = {}
+
+
+def _file_key(filepath: Path) -> tuple[int, int]:
+    """Identite d'une version du fichier (date de modification, taille)."""
+    st = filepath.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _digest(content: bytes) -> bytes:
+    """Empreinte du contenu d'un fichier."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _cache_written(filepath: Path, content: bytes) -> None:
+    """Memorise le contenu qui vient d'etre ecrit (evite de relire le fichier)."""
+    try:
+        _json_cache[filepath] = (_file_key(filepath), _json_loads(content), _digest(content))
+    except OSError:
+        _json_cache.pop(filepath, None)
+
+
+def _is_unchanged(filepath: Path, content: bytes) -> bool:
+    """Indique si le fichier contient deja exactement `content`."""
+    cached = _json_cache.get(filepath)
+    if cached is None or cached[2] != _digest(content):
+        return False
+    try:
+        return _file_key(filepath) == cached[0]
+    except OSError:
+        return False
+
+
 def load_json(filepath: Path, default: Any = None) -> Any:
     """Charge un fichier JSON.
 
+    Le contenu est memorise tant que la date de modification et la taille
+    du fichier ne changent pas ; chaque appel retourne une copie modifiable.
+
     Args:
         filepath: Chemin du fichier JSON.
         default: Valeur par defaut si le fichier n'existe pas ou est invalide.
@@ -121,21 +222,33 @@ def load_json(filepath: Path, default: Any = None) -> Any:
     Returns:
         Contenu du fichier JSON ou la valeur par defaut.
     """
-    if not filepath.exists():
+    try:
+        key = _file_key(filepath)
+    except OSError:
         return default if default is not None else {}
+
+    cached = _json_cache.get(filepath)
+    if cached is not None and cached[0] == key:
+        return copy.deepcopy(cached[1])
+
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        raw = filepath.read_bytes()
+        data = _json_loads(raw)
+    except (ValueError, IOError) as e:
         logger.warning(f"Impossible de lire {filepath}: {e}")
         return default if default is not None else {}
 
+    _json_cache[filepath] = (key, data, _digest(raw))
+    return copy.deepcopy(data)
+
 
 def save_json(filepath: Path, data: Any, *, secure: bool = False) -> bool:
     """Sauvegarde des donnees en JSON avec ecriture atomique.
 
-    Utilise un fichier temporaire puis rename pour eviter la corruption
-    en cas de crash pendant l'ecriture.
+    Utilise un fichier temporaire puis os.replace pour eviter la corruption
+    en cas de crash pendant l'ecriture. Seuls les fichiers sensibles sont
+    synchronises sur disque (fsync) : les autres sont recreables. Rien n'est
+    ecrit si le fichier contient deja exactement ces donnees.
 
     Args:
         filepath: Chemin du fichier JSON.
@@ -145,10 +258,48 @@ def save_json(filepath: Path, data: Any, *, secure: bool = False) -> bool:
     Returns:
         True si la sauvegarde a reussi, False sinon.
     """
+    content = _json_dumps(data)
+    if _is_unchanged(filepath, content):
+        return True
+
+    _json_cache.pop(filepath, None)
+    saved = _write_atomic(
+        filepath, content, sensitive=secure or filepath in SENSITIVE_FILES
+    )
+    if saved:
+        _cache_written(filepath, content)
+    return saved
+
+
+async def save_json_async(filepath: Path, data: Any, *, secure: bool = False) -> bool:
+    """Variante de save_json qui n'ecrit pas depuis la boucle asyncio.
+
+    L'encodage reste sur la boucle ; l'ecriture disque est deleguee a
+    l'executor par defaut.
+    """
+    content = _json_dumps(data)
+    if _is_unchanged(filepath, content):
+        return True
+
+    _json_cache.pop(filepath, None)
+    sensitive = secure or filepath in SENSITIVE_FILES
+    loop = asyncio.get_running_loop()
+    saved = await loop.run_in_executor(
+        None, partial(_write_atomic, filepath, content, sensitive=sensitive)
+    )
+    if saved:
+        _cache_written(filepath, content)
+    return saved
+
+
+def _write_atomic(filepath: Path, content: bytes, *, sensitive: bool) -> bool:
+    """Ecrit un fichier via fichier temporaire + os.replace."""
     temp_fd = None
     temp_path = None
     try:
-        # Creer un fichier temporaire dans le meme repertoire (pour atomic rename)
+        # Creer un fichier temporaire dans le meme repertoire (pour atomic rename).
+        # mkstemp le cree en 0o600 : les fichiers sensibles ont deja les bonnes
+        # permissions, sans chmod supplementaire.
         temp_fd, temp_path_str = tempfile.mkstemp(
             dir=filepath.parent,
             prefix=f".{filepath.name}.",
@@ -157,16 +308,15 @@ def save_json(filepath: Path, data: Any, *, secure: bool = False) -> bool:
         temp_path = Path(temp_path_str)
 
         # Ecrire dans le fichier temporaire
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+        with os.fdopen(temp_fd, "wb") as f:
             temp_fd = None  # fdopen prend possession du fd
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        # Appliquer les permissions avant le rename si fichier sensible
-        if secure or filepath in SENSITIVE_FILES:
-            temp_path.chmod(0o600)
+            f.write(content)
+            if sensitive:
+                f.flush()
+                os.fsync(f.fileno())
 
         # Atomic rename (POSIX garantit l'atomicite)
-        shutil.move(temp_path, filepath)
+        os.replace(temp_path, filepath)
         temp_path = None
 
         return True
@@ -182,8 +332,8 @@ def save_json(filepath: Path, data: Any, *, secure: bool = False) -> bool:
                 os.close(temp_fd)
             except OSError:
                 pass
-        if temp_path is not None and temp_path.exists():
+        if temp_path is not None:
             try:
-                temp_path.unlink()
+                temp_path.unlink(missing_ok=True)
             except OSError:
                 pass
@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import asynccontextmanager
-from functools import wraps
-from typing import Callable, Optional, Union
+import copy
+import re
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache, wraps
+from typing import Callable, Iterator, Optional, Union
 
 import pyatv
 from pyatv.const import FeatureName, FeatureState, Protocol
 from pyatv.interface import AppleTV
 
 from .config import (
+    CACHED_SCAN_TIMEOUT,
     CREDENTIALS_FILE,
+    KNOWN_DEVICES_FILE,
+    LAST_DEVICE_FILE,
     SCAN_TIMEOUT,
     load_json,
     logger,
@@ -31,25 +37,72 @@ def load_credentials() -> dict[str, dict[str, str]]:
     return load_json(CREDENTIALS_FILE, {})
 
 
-def save_credentials(identifier: str, protocol: str, credentials: str) -> None:
-    """Sauvegarde les credentials (fichier protege en 600)."""
+def save_credentials(
+    identifier: str,
+    protocol: str,
+    credentials: str,
+    batch: Optional[dict[str, dict[str, str]]] = None,
+) -> None:
+    """Sauvegarde les credentials (fichier protege en 600).
+
+    Args:
+        identifier: Identifiant de l'appareil.
+        protocol: Nom du protocole.
+        credentials: Credentials a sauvegarder.
+        batch: Credentials d'une credentials_session ; l'ecriture est alors
+            faite une seule fois a la sortie de la session.
+    """
+    if batch is not None:
+        batch.setdefault(identifier, {})[protocol] = credentials
+        return
+
+    with credentials_session() as all_creds:
+        all_creds.setdefault(identifier, {})[protocol] = credentials
+
+
+@contextmanager
+def credentials_session() -> Iterator[dict[str, dict[str, str]]]:
+    """Charge les credentials et les ecrit une seule fois en sortie, si modifies."""
     all_creds = load_credentials()
-    if identifier not in all_creds:
-        all_creds[identifier] = {}
-    all_creds[identifier][protocol] = credentials
-    if save_json(CREDENTIALS_FILE, all_creds, secure=True):
-        logger.info(f"Credentials sauvegardes dans {CREDENTIALS_FILE}")
-
-
-def apply_credentials(device_config: pyatv.interface.BaseConfig) -> bool:
-    """Applique les credentials sauvegardes a la configuration."""
-    all_creds = load_credentials()
-    identifier = device_config.identifier
+    original = copy.deepcopy(all_creds)
+    try:
+        yield all_creds
+    finally:
+        # Conserver les appairages reussis meme si la session est interrompue
+        if all_creds != original:
+            if save_json(CREDENTIALS_FILE, all_creds, secure=True):
+                logger.info(f"Credentials sauvegardes dans {CREDENTIALS_FILE}")
+            _device_credentials.cache_clear()
+
+
+@lru_cache(maxsize=16)
+def _device_credentials(identifier: str, mtime_ns: int) -> dict[str, str]:
+    """Retourne les credentials d'un appareil (memoise par date de modification)."""
+    return load_credentials().get(identifier, {})
+
+
+def apply_credentials(
+    device_config: pyatv.interface.BaseConfig,
+    all_creds: Optional[dict[str, dict[str, str]]] = None,
+) -> bool:
+    """Applique les credentials sauvegardes a la configuration.
+
+    Args:
+        device_config: Configuration de l'appareil.
+        all_creds: Credentials deja charges (evite une relecture du fichier).
+    """
+    if all_creds is not None:
+        device_creds = all_creds.get(device_config.identifier, {})
+    else:
+        try:
+            mtime_ns = CREDENTIALS_FILE.stat().st_mtime_ns
+        except OSError:
+            return False
+        device_creds = _device_credentials(device_config.identifier, mtime_ns)
 
-    if identifier not in all_creds:
+    if not device_creds:
         return False
 
-    device_creds = all_creds[identifier]
     applied = False
 
     for service in device_config.services:
@@ -67,23 +120,101 @@ def apply_credentials(device_config: pyatv.interface.BaseConfig) -> bool:
 # =============================================================================
 
 
-@asynccontextmanager
-async def connect_atv(device_config: pyatv.interface.BaseConfig):
-    """Context manager pour la connexion Apple TV."""
+async def open_atv(
+    device_config: pyatv.interface.BaseConfig,
+    all_creds: Optional[dict[str, dict[str, str]]] = None,
+) -> AppleTV:
+    """Ouvre une connexion Apple TV (a fermer avec close_atv).
+
+    Preferer connect_atv, sauf pour garder une connexion au-dela d'un bloc.
+    """
     logger.info(f"Connexion a {device_config.name}...")
 
-    if apply_credentials(device_config):
+    if apply_credentials(device_config, all_creds):
         logger.info("Credentials charges.")
     else:
         logger.warning("Aucun credential trouve. Utilisez 'pair' d'abord.")
 
     atv = await pyatv.connect(device_config, asyncio.get_running_loop())
     logger.info("Connecte!")
+    return atv
+
+
+def close_atv(atv: AppleTV) -> None:
+    """Ferme une connexion ouverte par open_atv."""
+    clear_feature_cache(atv)
+    atv.close()
+
 
+@asynccontextmanager
+async def connect_atv(
+    device_config: pyatv.interface.BaseConfig,
+    all_creds: Optional[dict[str, dict[str, str]]] = None,
+):
+    """Context manager pour la connexion Apple TV."""
+    atv = await open_atv(device_config, all_creds)
     try:
         yield atv
     finally:
-        atv.close()
+        close_atv(atv)
+
+
+# Disponibilite des fonctionnalites, memorisee par connexion
+_feature_cache: weakref.WeakKeyDictionary[AppleTV, dict[FeatureName, bool]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Seules les fonctionnalites independantes de l'etat de l'appareil sont
+# memorisees. Lecture, alimentation et volume changent sur une connexion
+# gardee ouverte (daemon, scheduler) : elles sont relues a chaque appel.
+_STATIC_FEATURES = frozenset({
+    FeatureName.Up,
+    FeatureName.Down,
+    FeatureName.Left,
+    FeatureName.Right,
+    FeatureName.Select,
+    FeatureName.Menu,
+    FeatureName.Home,
+    FeatureName.TurnOn,
+    FeatureName.TurnOff,
+    FeatureName.AppList,
+    FeatureName.LaunchApp,
+})
+
+
+def is_feature_available(atv: AppleTV, feature: FeatureName) -> bool:
+    """Indique si une fonctionnalite est disponible.
+
+    Le resultat est memorise par connexion pour les fonctionnalites de
+    _STATIC_FEATURES uniquement.
+    """
+    if feature not in _STATIC_FEATURES:
+        return atv.features.in_state(FeatureState.Available, feature)
+
+    features = _feature_cache.get(atv)
+    if features is None:
+        features = _feature_cache[atv] = {}
+
+    available = features.get(feature)
+    if available is None:
+        available = features[feature] = atv.features.in_state(
+            FeatureState.Available, feature
+        )
+    return available
+
+
+def clear_feature_cache(atv: AppleTV) -> None:
+    """Oublie la disponibilite memorisee des fonctionnalites d'une connexion."""
+    _feature_cache.pop(atv, None)
+
+
+def ensure_feature(atv: AppleTV, feature: FeatureName) -> None:
+    """Leve FeatureNotAvailableError si la fonctionnalite est indisponible."""
+    if not is_feature_available(atv, feature):
+        raise FeatureNotAvailableError(
+            f"Fonctionnalite {feature.name} non disponible. "
+            "Assurez-vous d'avoir appaire l'appareil."
+        )
 
 
 def require_feature(feature: FeatureName):
@@ -92,11 +223,7 @@ def require_feature(feature: FeatureName):
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(atv: AppleTV, *args, **kwargs):
-            if not atv.features.in_state(FeatureState.Available, feature):
-                raise FeatureNotAvailableError(
-                    f"Fonctionnalite {feature.name} non disponible. "
-                    "Assurez-vous d'avoir appaire l'appareil."
-                )
+            ensure_feature(atv, feature)
             return await func(atv, *args, **kwargs)
 
         return wrapper
@@ -109,13 +236,143 @@ def require_feature(feature: FeatureName):
 # =============================================================================
 
 
-async def scan_devices(timeout: int = SCAN_TIMEOUT) -> list[pyatv.interface.BaseConfig]:
-    """Scanne le reseau pour trouver les Apple TV."""
+async def scan_devices(
+    timeout: int = SCAN_TIMEOUT,
+    *,
+    identifier: Optional[str] = None,
+    name: Optional[str] = None,
+) -> list[pyatv.interface.BaseConfig]:
+    """Scanne le reseau pour trouver les Apple TV.
+
+    Args:
+        timeout: Duree maximale du scan (secondes).
+        identifier: Ne rechercher que cet appareil (filtre fait par pyatv).
+        name: Nom de l'appareil attendu ; un scan court est tente d'abord et
+            suffit si un appareil porte exactement ce nom.
+    """
     logger.info("Recherche des Apple TV...")
-    devices = await pyatv.scan(asyncio.get_running_loop(), timeout=timeout)
+    loop = asyncio.get_running_loop()
+
+    if name is not None and timeout > CACHED_SCAN_TIMEOUT:
+        devices = await pyatv.scan(
+            loop, timeout=CACHED_SCAN_TIMEOUT, identifier=identifier
+        )
+        wanted = name.casefold()
+        if any((device.name or "").casefold() == wanted for device in devices):
+            return devices
+        timeout -= CACHED_SCAN_TIMEOUT
+
+    devices = await pyatv.scan(loop, timeout=timeout, identifier=identifier)
     return devices
 
 
+async def scan_last_device(
+    timeout: int = CACHED_SCAN_TIMEOUT,
+) -> list[pyatv.interface.BaseConfig]:
+    """Scan unicast du dernier appareil utilise (evite le scan multicast).
+
+    Returns:
+        L'appareil s'il a repondu, sinon une liste vide.
+    """
+    last = load_json(LAST_DEVICE_FILE)
+    if not last.get("address"):
+        return []
+
+    logger.debug(f"Scan unicast de {last.get('name')} ({last['address']})")
+    return await pyatv.scan(
+        asyncio.get_running_loop(),
+        timeout=timeout,
+        identifier=last.get("identifier"),
+        hosts=[last["address"]],
+    )
+
+
+async def scan_known_devices(
+    name: str, timeout: int = CACHED_SCAN_TIMEOUT
+) -> list[pyatv.interface.BaseConfig]:
+    """Scan unicast des appareils deja utilises portant ce nom.
+
+    Seule l'egalite (sans tenir compte de la casse) est retenue : pour une
+    sous-chaine, un appareil jamais utilise pourrait porter le nom exact et
+    seul le scan complet le trouverait.
+
+    Returns:
+        Le premier appareil qui a repondu, sinon une liste vide.
+    """
+    wanted = name.casefold()
+    known = load_json(KNOWN_DEVICES_FILE)
+    matches = [
+        (identifier, entry)
+        for identifier, entry in known.items()
+        if (entry.get("name") or "").casefold() == wanted and entry.get("address")
+    ]
+    if not matches:
+        return []
+
+    # Un scan par adresse, en parallele : le premier appareil qui repond
+    # suffit, sans attendre les adresses perimees jusqu'au timeout
+    loop = asyncio.get_running_loop()
+    tasks = [
+        asyncio.create_task(
+            pyatv.scan(loop, timeout=timeout, identifier=identifier, hosts=[entry["address"]])
+        )
+        for identifier, entry in matches
+    ]
+    logger.debug(f"Scan unicast de {name} ({len(tasks)} adresse(s))")
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            devices = await next_done
+            if devices:
+                return devices
+    finally:
+        for task in tasks:
+            task.cancel()
+    return []
+
+
+# Selecteurs adressant directement un appareil (pas besoin de scan multicast)
+_IPV4_RE = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+_IDENTIFIER_RE = re.compile(
+    r"^(?:[0-9A-Fa-f]{2}(?:[:-]?[0-9A-Fa-f]{2}){5}"
+    r"|[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{12})$"
+)
+
+
+def is_direct_selector(selector: str) -> bool:
+    """Indique si le selecteur est une adresse IPv4 ou un identifiant d'appareil."""
+    return bool(_IPV4_RE.match(selector) or _IDENTIFIER_RE.match(selector))
+
+
+async def scan_targeted(
+    selector: str, timeout: int = CACHED_SCAN_TIMEOUT
+) -> list[pyatv.interface.BaseConfig]:
+    """Scan unicast d'un appareil designe par son adresse IP ou son identifiant."""
+    loop = asyncio.get_running_loop()
+    if _IPV4_RE.match(selector):
+        logger.debug(f"Scan unicast de {selector}")
+        return await pyatv.scan(loop, timeout=timeout, hosts=[selector])
+
+    logger.debug(f"Scan de l'identifiant {selector}")
+    return await pyatv.scan(loop, timeout=timeout, identifier=selector)
+
+
+def remember_device(device_config: pyatv.interface.BaseConfig) -> None:
+    """Memorise l'appareil utilise (scan_last_device, scan_known_devices)."""
+    last = {
+        "identifier": device_config.identifier,
+        "address": str(device_config.address),
+        "name": device_config.name,
+    }
+    if load_json(LAST_DEVICE_FILE) != last:
+        save_json(LAST_DEVICE_FILE, last)
+
+    known = load_json(KNOWN_DEVICES_FILE)
+    entry = {"name": last["name"], "address": last["address"]}
+    if known.get(last["identifier"]) != entry:
+        known[last["identifier"]] = entry
+        save_json(KNOWN_DEVICES_FILE, known)
+
+
 def select_device(
     devices: list[pyatv.interface.BaseConfig],
     selector: Optional[Union[int, str]] = None,
@@ -134,27 +391,58 @@ def select_device(
             return devices[selector]
         raise DeviceNotFoundError(f"Index {selector} invalide (0-{len(devices) - 1})")
 
-    # Selection par nom
+    # Selection par adresse ou identifiant exacts
     if isinstance(selector, str):
         for device in devices:
-            if selector.lower() in device.name.lower():
+            if selector == str(device.address) or selector == device.identifier:
+                return device
+
+    # Selection par nom (egalite exacte prioritaire, puis sous-chaine)
+    if isinstance(selector, str):
+        wanted = selector.casefold()
+        by_name: dict[str, pyatv.interface.BaseConfig] = {}
+        for device in devices:
+            by_name.setdefault((device.name or "").casefold(), device)
+
+        device = by_name.get(wanted)
+        if device is not None:
+            return device
+        for name, device in by_name.items():
+            if wanted in name:
                 return device
         raise DeviceNotFoundError(f"Appareil '{selector}' non trouve")
 
     # Selection interactive
-    print(f"\n{len(devices)} appareil(s) trouve(s):\n")
-    for i, device in enumerate(devices):
-        print(f"  [{i}] {device.name} ({device.address})")
-    print()
+    _print_device_choices(devices)
 
     while True:
-        try:
-            choice = int(input(f"Choisissez (0-{len(devices) - 1}): "))
-            if 0 <= choice < len(devices):
-                return devices[choice]
-            print("Index invalide.")
-        except ValueError:
-            print("Entrez un nombre.")
+        device = _parse_device_choice(
+            devices, input(f"Choisissez (0-{len(devices) - 1}): ")
+        )
+        if device is not None:
+            return device
+
+
+def _print_device_choices(devices: list[pyatv.interface.BaseConfig]) -> None:
+    """Affiche la liste numerotee des appareils."""
+    lines = [f"\n{len(devices)} appareil(s) trouve(s):\n"]
+    lines.extend(f"  [{i}] {device.name} ({device.address})" for i, device in enumerate(devices))
+    print("\n".join(lines) + "\n")
+
+
+def _parse_device_choice(
+    devices: list[pyatv.interface.BaseConfig], answer: str
+) -> Optional[pyatv.interface.BaseConfig]:
+    """Interprete la saisie de l'utilisateur (None si invalide)."""
+    try:
+        choice = int(answer)
+    except ValueError:
+        print("Entrez un nombre.")
+        return None
+    if 0 <= choice < len(devices):
+        return devices[choice]
+    print("Index invalide.")
+    return None
 
 
 # =============================================================================
@@ -163,9 +451,17 @@ def select_device(
 
 
 async def pair_protocol(
-    device_config: pyatv.interface.BaseConfig, protocol: Protocol
+    device_config: pyatv.interface.BaseConfig,
+    protocol: Protocol,
+    batch: Optional[dict[str, dict[str, str]]] = None,
 ) -> Optional[str]:
-    """Appaire un protocole specifique."""
+    """Appaire un protocole specifique.
+
+    Args:
+        device_config: Configuration de l'appareil.
+        protocol: Protocole a appairer.
+        batch: Credentials d'une credentials_session (voir save_credentials).
+    """
     logger.info(f"\n--- Appairage {protocol.name} ---")
     logger.info("Un code PIN va s'afficher sur votre Apple TV.\n")
 
@@ -186,7 +482,7 @@ async def pair_protocol(
             logger.info(f"Appairage {protocol.name} reussi!")
             credentials = pairing.service.credentials
             save_credentials(
-                device_config.identifier, protocol.name, credentials
+                device_config.identifier, protocol.name, credentials, batch
             )
             return credentials
         else:
@@ -208,24 +504,25 @@ async def pair_device(device_config: pyatv.interface.BaseConfig) -> bool:
 
     success_count = 0
 
-    for protocol in protocols_to_pair:
-        if protocol not in available_protocols:
-            logger.info(f"  {protocol.name}: non disponible")
-            continue
-
-        # Verifier si deja appaire
-        creds = load_credentials()
-        if device_config.identifier in creds and protocol.name in creds[device_config.identifier]:
-            logger.info(f"  {protocol.name}: deja appaire")
-            success_count += 1
-            continue
+    # Une seule ecriture de credentials.json pour tous les protocoles
+    with credentials_session() as all_creds:
+        for protocol in protocols_to_pair:
+            if protocol not in available_protocols:
+                logger.info(f"  {protocol.name}: non disponible")
+                continue
 
-        try:
-            result = await pair_protocol(device_config, protocol)
-            if result:
+            # Verifier si deja appaire
+            if protocol.name in all_creds.get(device_config.identifier, {}):
+                logger.info(f"  {protocol.name}: deja appaire")
                 success_count += 1
-        except Exception as e:
-            logger.error(f"  Erreur {protocol.name}: {e}")
+                continue
+
+            try:
+                result = await pair_protocol(device_config, protocol, all_creds)
+                if result:
+                    success_count += 1
+            except Exception as e:
+                logger.error(f"  Erreur {protocol.name}: {e}")
 
     if success_count > 0:
         logger.info(f"\n[OK] {success_count} protocole(s) appaire(s)!")
@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import weakref
 from enum import Enum
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from pyatv.const import FeatureName, FeatureState
 from pyatv.interface import AppleTV
 
 from .config import OPERATION_TIMEOUT, logger
-from .connection import require_feature
+from .connection import is_feature_available, require_feature
 from .exceptions import FeatureNotAvailableError
 
 
@@ -143,13 +144,29 @@ class RemoteButton(Enum):
         self.symbol = symbol
 
 
+# Methodes de telecommande liees a chaque bouton, memorisees par connexion
+_button_methods: weakref.WeakKeyDictionary[
+    AppleTV, dict[RemoteButton, Callable[[], Awaitable[None]]]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_button_methods(atv: AppleTV) -> dict[RemoteButton, Callable[[], Awaitable[None]]]:
+    """Retourne la table bouton -> methode pour une connexion."""
+    methods = _button_methods.get(atv)
+    if methods is None:
+        remote = atv.remote_control
+        methods = _button_methods[atv] = {
+            button: getattr(remote, button.cmd) for button in RemoteButton
+        }
+    return methods
+
+
 async def press_button(atv: AppleTV, button: RemoteButton) -> None:
     """Appuie sur un bouton de la telecommande."""
-    if not atv.features.in_state(FeatureState.Available, button.feature):
+    if not is_feature_available(atv, button.feature):
         raise FeatureNotAvailableError(f"Bouton {button.cmd} non disponible")
 
-    method = getattr(atv.remote_control, button.cmd)
-    await method()
+    await _get_button_methods(atv)[button]()
     logger.info(f"{button.symbol} {button.cmd.capitalize()}")
 
 
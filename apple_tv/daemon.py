@@ -0,0 +1,303 @@
+"""Daemon gardant une connexion Apple TV ouverte (socket Unix)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+from functools import partial
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+import pyatv
+from pyatv.exceptions import ConnectionFailedError, ConnectionLostError
+from pyatv.interface import AppleTV, DeviceListener
+
+from .apps import launch_app, list_apps, sync_apps_config
+from .config import DAEMON_SOCKET, logger
+from .connection import close_atv, open_atv
+from .controls import (
+    RemoteButton,
+    cmd_next,
+    cmd_pause,
+    cmd_play,
+    cmd_play_pause,
+    cmd_previous,
+    cmd_stop,
+    get_power_status,
+    get_volume,
+    press_button,
+    set_volume,
+    turn_off,
+    turn_on,
+    volume_down,
+    volume_up,
+)
+from .exceptions import AppleTVError
+from .scenarios import run_scenario
+
+# Commandes sans argument : nom -> coroutine prenant la connexion
+_ATV_COMMANDS: dict[str, Callable[[AppleTV], Awaitable[Any]]] = {
+    "status": get_power_status,
+    "on": turn_on,
+    "off": turn_off,
+    "play": cmd_play,
+    "pause": cmd_pause,
+    "play_pause": cmd_play_pause,
+    "stop": cmd_stop,
+    "next": cmd_next,
+    "previous": cmd_previous,
+    **{button.cmd: partial(press_button, button=button) for button in RemoteButton},
+    "volume_up": volume_up,
+    "volume_down": volume_down,
+    "apps": list_apps,
+    "apps_sync": sync_apps_config,
+}
+
+# Commandes executables sur une connexion ouverte (CLI et daemon)
+DEVICE_COMMANDS = frozenset(_ATV_COMMANDS) | {"volume", "launch", "scenario"}
+
+# Sockets Unix indisponibles (Windows) : pas de daemon
+_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+# Erreurs imposant de rouvrir la connexion a la commande suivante
+_CONNECTION_ERRORS = (ConnectionLostError, ConnectionFailedError, OSError)
+
+
+# =============================================================================
+# EXECUTION DES COMMANDES
+# =============================================================================
+
+
+async def execute_command(atv: AppleTV, command: str, params: dict[str, Any]) -> None:
+    """Execute une commande sur une connexion ouverte.
+
+    Args:
+        atv: Connexion Apple TV.
+        command: Nom de la commande (voir DEVICE_COMMANDS).
+        params: Arguments de la commande (level, app, name).
+    """
+    handler = _ATV_COMMANDS.get(command)
+    if handler is not None:
+        await handler(atv)
+
+    elif command == "volume":
+        if params.get("level") is not None:
+            await set_volume(atv, params["level"])
+        else:
+            await get_volume(atv)
+
+    elif command == "launch":
+        await launch_app(atv, params["app"])
+
+    elif command == "scenario":
+        if not await run_scenario(atv, params["name"]):
+            raise AppleTVError(f"Scenario '{params['name']}' echoue")
+
+    else:
+        raise ValueError(f"Commande inconnue: {command}")
+
+
+# =============================================================================
+# SERVEUR (DAEMON)
+# =============================================================================
+
+
+async def run_daemon(
+    device_config: pyatv.interface.BaseConfig,
+    socket_path: Path = DAEMON_SOCKET,
+) -> None:
+    """Garde la connexion ouverte et execute les commandes recues.
+
+    Protocole : une requete JSON par ligne, par exemple
+    {"cmd": "volume", "args": {"level": 30}}, et une reponse JSON par
+    ligne : {"ok": true, "output": [...]} ou {"ok": false, "error": "..."}.
+    "output" contient les messages affiches par la commande.
+
+    Une connexion perdue est rouverte a la commande suivante.
+    """
+    if not _UNIX_SOCKETS:
+        raise AppleTVError("Daemon indisponible : pas de sockets Unix sur cette plateforme")
+
+    if await _daemon_running(socket_path):
+        raise AppleTVError(f"Un daemon tourne deja sur {socket_path}")
+
+    connection = _DaemonConnection(device_config)
+    # Connexion immediate : une erreur d'appairage apparait au lancement
+    await connection.get()
+    # Une seule commande a la fois sur la connexion
+    lock = asyncio.Lock()
+
+    async def handle_client(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            async for line in reader:
+                response = await _handle_request(connection, lock, line)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    try:
+        # Socket orpheline d'un daemon arrete sans nettoyage
+        socket_path.unlink(missing_ok=True)
+        # Socket privee des sa creation : aucun autre utilisateur ne peut
+        # s'y connecter entre le bind et un chmod
+        old_umask = os.umask(0o077)
+        try:
+            server = await asyncio.start_unix_server(handle_client, path=str(socket_path))
+        finally:
+            os.umask(old_umask)
+        logger.info(f"Daemon pret sur {socket_path} ({device_config.name})")
+
+        async with server:
+            await server.serve_forever()
+    finally:
+        socket_path.unlink(missing_ok=True)
+        connection.close()
+
+
+async def _daemon_running(socket_path: Path) -> bool:
+    """Indique si un daemon repond deja sur la socket."""
+    try:
+        _, writer = await asyncio.open_unix_connection(str(socket_path))
+    except OSError:
+        return False
+    writer.close()
+    return True
+
+
+class _DaemonConnection:
+    """Connexion du daemon, rouverte a la demande apres une perte."""
+
+    def __init__(self, device_config: pyatv.interface.BaseConfig) -> None:
+        self._device_config = device_config
+        self._atv: Optional[AppleTV] = None
+
+    async def get(self) -> AppleTV:
+        """Retourne la connexion ouverte, en la rouvrant si besoin."""
+        if self._atv is None:
+            atv = await open_atv(self._device_config)
+            atv.listener = _DaemonListener(self, atv)
+            self._atv = atv
+        return self._atv
+
+    def forget(self, atv: AppleTV) -> None:
+        """Oublie une connexion perdue (sans effet si elle a ete remplacee)."""
+        if self._atv is atv:
+            self._atv = None
+
+    def close(self) -> None:
+        """Ferme la connexion courante."""
+        atv, self._atv = self._atv, None
+        if atv is not None:
+            close_atv(atv)
+
+
+class _DaemonListener(DeviceListener):
+    """Signale au daemon la perte ou la fermeture de sa connexion."""
+
+    def __init__(self, connection: _DaemonConnection, atv: AppleTV) -> None:
+        self._connection = connection
+        self._atv = atv
+
+    def connection_lost(self, exception: Exception) -> None:
+        logger.warning(f"Connexion perdue: {exception}")
+        self._connection.forget(self._atv)
+
+    def connection_closed(self) -> None:
+        self._connection.forget(self._atv)
+
+
+async def _handle_request(
+    connection: _DaemonConnection, lock: asyncio.Lock, line: bytes
+) -> dict[str, Any]:
+    """Decode et execute une requete du client."""
+    try:
+        request = json.loads(line)
+        command = request["cmd"]
+        params = request.get("args") or {}
+    except (ValueError, KeyError, TypeError):
+        return {"ok": False, "error": "Requete invalide"}
+
+    if command not in DEVICE_COMMANDS:
+        return {"ok": False, "error": f"Commande inconnue: {command}"}
+
+    capture = _OutputCapture()
+    try:
+        async with lock:
+            atv = await connection.get()
+            logger.addHandler(capture)
+            try:
+                await execute_command(atv, command, params)
+            except _CONNECTION_ERRORS:
+                # Reconnexion a la commande suivante
+                connection.close()
+                raise
+            finally:
+                logger.removeHandler(capture)
+    except Exception as e:
+        logger.error(f"Erreur {command}: {e}")
+        return {"ok": False, "error": str(e)}
+
+    return {"ok": True, "output": capture.lines}
+
+
+class _OutputCapture(logging.Handler):
+    """Collecte les messages du logger pendant une commande."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.INFO)
+        self.lines: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(record.getMessage())
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+
+async def send_command(
+    command: str,
+    params: dict[str, Any],
+    socket_path: Path = DAEMON_SOCKET,
+) -> Optional[dict[str, Any]]:
+    """Transmet une commande au daemon s'il tourne.
+
+    Returns:
+        La reponse du daemon, ou None s'il n'est pas joignable.
+    """
+    if not _UNIX_SOCKETS:
+        return None
+
+    try:
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+    except (OSError, NotImplementedError):
+        # Pas de socket, socket orpheline (daemon arrete sans nettoyage)
+        # ou boucle sans sockets Unix
+        return None
+
+    try:
+        request = {"cmd": command, "args": params}
+        writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await writer.drain()
+        line = await reader.readline()
+    except OSError:
+        line = b""
+    finally:
+        writer.close()
+
+    # Daemon arrete pendant la commande : ne pas la rejouer localement
+    if not line:
+        return {"ok": False, "error": "Connexion au daemon perdue"}
+    try:
+        return json.loads(line)
+    except ValueError:
+        return {"ok": False, "error": "Reponse invalide du daemon"}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Literal, Optional
 
@@ -22,8 +23,12 @@ class ValidationError(Exception):
 # Delai par defaut entre les actions de navigation (en secondes)
 DEFAULT_ACTION_DELAY = 0.5
 
+# Etapes sans __dict__ (plus compactes, acces aux attributs plus rapide).
+# dataclass(slots=True) n'existe qu'a partir de Python 3.10.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ScenarioStep:
     """Etape d'un scenario avec validation."""
 
@@ -33,6 +38,9 @@ class ScenarioStep:
     name: Optional[str] = None  # Pour l'action "scenario"
     repeat: int = 1
     delay: float = DEFAULT_ACTION_DELAY
+    inter_delay: Optional[float] = None  # Pause entre repetitions (defaut: delay)
+    burst: bool = False  # Envoyer toutes les repetitions en meme temps
+    pipeline: Optional[bool] = None  # Pipeliner les repetitions (defaut: fleches)
 
     def __post_init__(self) -> None:
         """Valide les champs apres initialisation."""
@@ -60,6 +68,24 @@ class ScenarioStep:
         if self.delay < 0:
             raise ValidationError(f"'delay' doit etre >= 0, recu: {self.delay}")
 
+        if self.inter_delay is not None and self.inter_delay < 0:
+            raise ValidationError(
+                f"'inter_delay' doit etre >= 0, recu: {self.inter_delay}"
+            )
+
+        if not isinstance(self.burst, bool):
+            raise ValidationError(
+                f"'burst' doit etre true ou false, recu: {self.burst!r}"
+            )
+
+        if self.pipeline is not None and not isinstance(self.pipeline, bool):
+            raise ValidationError(
+                f"'pipeline' doit etre true ou false, recu: {self.pipeline!r}"
+            )
+
+        if self.burst and self.pipeline is not None:
+            raise ValidationError("'burst' et 'pipeline' sont incompatibles")
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ScenarioStep:
         """Cree une etape depuis un dictionnaire."""
@@ -70,6 +96,9 @@ class ScenarioStep:
             name=data.get("name"),
             repeat=data.get("repeat", 1),
             delay=data.get("delay", DEFAULT_ACTION_DELAY),
+            inter_delay=data.get("inter_delay"),
+            burst=data.get("burst", False),
+            pipeline=data.get("pipeline"),
         )
 
 
@@ -152,6 +181,9 @@ def validate_schedule_entry(data: dict[str, Any], index: int) -> None:
     """
     prefix = f"Planification [{index}]"
 
+    if not isinstance(data, dict):
+        raise ValidationError(f"{prefix}: doit etre un objet")
+
     # Champs requis
     if not data.get("scenario"):
         raise ValidationError(f"{prefix}: 'scenario' requis")
@@ -3,21 +3,52 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import copy
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
-from pyatv.interface import AppleTV
-
-from .apps import launch_app
 from .config import (
     DEFAULT_SCENARIOS,
+    PIPELINE_MIN_SPACING,
     REPEAT_DELAY,
     SCENARIOS_FILE,
     load_json,
     logger,
-    save_json,
 )
 from .constants import SWIPE_GESTURES
-from .models import ValidationError, validate_scenarios
+from .models import Scenario, ScenarioStep, ValidationError, validate_scenarios
+
+# pyatv, apps et connection sont importes a l'execution seulement : lister
+# ou valider les scenarios ne charge pas la pile reseau.
+if TYPE_CHECKING:
+    from pyatv.interface import AppleTV
+
+
+# Scenarios valides de la derniere version lue : cle du fichier -> resultat.
+# Evite de reconstruire les etapes tant que scenarios.json ne change pas.
+_validated_cache: dict[tuple[Path, int, int] | None, dict[str, Scenario]] = {}
+
+
+def _scenarios_key() -> tuple[Path, int, int] | None:
+    """Version de scenarios.json (None s'il est absent : scenarios par defaut)."""
+    try:
+        st = SCENARIOS_FILE.stat()
+    except OSError:
+        return None
+    return SCENARIOS_FILE, st.st_mtime_ns, st.st_size
+
+
+def _validate_cached(
+    scenarios: dict[str, Any], key: tuple[Path, int, int] | None
+) -> dict[str, Scenario]:
+    """Valide les scenarios, sauf si cette version du fichier l'a deja ete."""
+    validated = _validated_cache.get(key)
+    if validated is None:
+        validated = validate_scenarios(scenarios)
+        _validated_cache.clear()
+        _validated_cache[key] = validated
+    return validated
 
 
 def load_scenarios(*, validate: bool = True) -> dict[str, dict[str, Any]]:
@@ -32,17 +63,34 @@ def load_scenarios(*, validate: bool = True) -> dict[str, dict[str, Any]]:
     Raises:
         ValidationError: Si validate=True et un scenario est invalide.
     """
+    key = _scenarios_key()
     scenarios = load_json(SCENARIOS_FILE)
     if not scenarios:
-        save_json(SCENARIOS_FILE, DEFAULT_SCENARIOS)
-        scenarios = DEFAULT_SCENARIOS.copy()
+        # Pas d'ecriture ici : scenarios.json est cree a la premiere sauvegarde
+        scenarios = copy.deepcopy(DEFAULT_SCENARIOS)
 
     if validate:
-        validate_scenarios(scenarios)
+        _validate_cached(scenarios, key)
 
     return scenarios
 
 
+def load_validated_scenarios() -> dict[str, Scenario]:
+    """Charge les scenarios sous forme d'objets valides (etapes typees).
+
+    Le resultat est partage entre les appels tant que scenarios.json ne
+    change pas (date de modification, taille) : ne pas le modifier.
+
+    Raises:
+        ValidationError: Si un scenario est invalide.
+    """
+    key = _scenarios_key()
+    validated = _validated_cache.get(key)
+    if validated is not None:
+        return validated
+    return _validate_cached(load_scenarios(validate=False), key)
+
+
 def show_scenarios() -> None:
     """Affiche les scenarios disponibles."""
     try:
@@ -51,138 +99,185 @@ def show_scenarios() -> None:
         logger.error(f"Erreur de validation:\n{e}")
         return
 
-    logger.info("\nScenarios disponibles:\n")
-    logger.info(f"{'Nom':<25} Description")
-    logger.info("-" * 70)
+    lines = ["\nScenarios disponibles:\n", f"{'Nom':<25} Description", "-" * 70]
 
     for name, data in sorted(scenarios.items()):
         desc = data.get("description", "-")
         steps = len(data.get("steps", []))
-        logger.info(f"{name:<25} {desc} ({steps} etapes)")
+        lines.append(f"{name:<25} {desc} ({steps} etapes)")
 
-    logger.info(f"\nTotal: {len(scenarios)} scenario(s)")
-    logger.info(f"Fichier: {SCENARIOS_FILE}")
+    lines.append(f"\nTotal: {len(scenarios)} scenario(s)")
+    lines.append(f"Fichier: {SCENARIOS_FILE}")
+    logger.info("\n".join(lines))
 
 
 MAX_SCENARIO_DEPTH = 10  # Protection contre recursion infinie
 
+# Actions directionnelles dont les repetitions sont pipelinees par defaut :
+# chaque appui part sans attendre la reponse du precedent. Les autres actions
+# restent sequentielles sauf si l'etape demande "pipeline": true.
+PIPELINE_ACTIONS = frozenset({"up", "down", "left", "right"})
+
+# Table d'actions : action -> (coroutine sans argument, libelle affiche)
+ActionDispatch = dict[str, tuple[Callable[[], Awaitable[None]], str]]
+
+
+# Actions envoyees par la methode du meme nom de remote_control -> libelle
+_REMOTE_ACTION_LABELS = {
+    "up": "^ Up",
+    "down": "v Down",
+    "left": "< Left",
+    "right": "> Right",
+    "select": "o Select",
+    "menu": "M Menu",
+    "home": "H Home",
+    "play": "> Play",
+    "pause": "|| Pause",
+    "play_pause": ">|| Play_pause",
+}
+
+_SWIPE_SYMBOLS = {
+    "swipe_up": "^^",
+    "swipe_down": "vv",
+    "swipe_left": "<<",
+    "swipe_right": ">>",
+}
+_SWIPE_LABELS = {
+    action: f"{_SWIPE_SYMBOLS.get(action, '')} {action.replace('_', ' ').title()}"
+    for action in SWIPE_GESTURES
+}
+
+
+def build_action_dispatch(atv: AppleTV) -> ActionDispatch:
+    """Construit la table des actions telecommande/lecture/swipe pour une connexion."""
+    rc = atv.remote_control
+
+    async def home_double() -> None:
+        await rc.home()
+        await asyncio.sleep(0.15)  # 150ms entre les deux appuis
+        await rc.home()
+
+    dispatch: ActionDispatch = {
+        action: (getattr(rc, action), label)
+        for action, label in _REMOTE_ACTION_LABELS.items()
+    }
+    dispatch["home_double"] = (home_double, "HH Home Double (App Switcher)")
+
+    for action, gesture in SWIPE_GESTURES.items():
+        dispatch[action] = (partial(atv.touch.swipe, *gesture), _SWIPE_LABELS[action])
+
+    return dispatch
+
+
+async def _pipeline_presses(
+    action_fn: Callable[[], Awaitable[None]],
+    label: str,
+    num: int,
+    repeat: int,
+    inter_delay: float,
+) -> None:
+    """Envoie des appuis repetes sans attendre chaque aller-retour.
+
+    Les appuis restent espaces de `inter_delay` (au moins
+    PIPELINE_MIN_SPACING pour preserver l'ordre), mais la latence reseau de
+    chaque appui se recouvre avec l'attente suivante. Tous les appuis sont
+    termines au retour de la fonction.
+    """
+    spacing = max(inter_delay, PIPELINE_MIN_SPACING)
+    tasks: list[asyncio.Task[None]] = []
+    try:
+        for i in range(repeat):
+            if i:
+                await asyncio.sleep(spacing)
+            logger.info(f"  [{num}] {label} ({i + 1}/{repeat})")
+            tasks.append(asyncio.create_task(action_fn()))
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
 
 async def execute_step(
     atv: AppleTV,
-    step: dict[str, Any],
+    step: ScenarioStep,
     num: int,
-    scenarios: dict[str, Any] | None = None,
+    scenarios: dict[str, Scenario] | None = None,
     depth: int = 0,
+    apps_config: dict[str, str] | None = None,
+    dispatch: ActionDispatch | None = None,
 ) -> bool:
-    """Execute une etape de scenario."""
-    action = step.get("action")
-    repeat = step.get("repeat", 1)
-    delay = step.get("delay", 0.5)
-
-    if not action:
-        logger.error(f"  [{num}] Action manquante")
-        return False
-
-    nav_actions = {
-        "up": atv.remote_control.up,
-        "down": atv.remote_control.down,
-        "left": atv.remote_control.left,
-        "right": atv.remote_control.right,
-        "select": atv.remote_control.select,
-        "menu": atv.remote_control.menu,
-        "home": atv.remote_control.home,
-    }
-
-    play_actions = {
-        "play": atv.remote_control.play,
-        "pause": atv.remote_control.pause,
-        "play_pause": atv.remote_control.play_pause,
-    }
-
-    symbols = {
-        "up": "^",
-        "down": "v",
-        "left": "<",
-        "right": ">",
-        "select": "o",
-        "menu": "M",
-        "home": "H",
-        "home_double": "HH",
-        "play": ">",
-        "pause": "||",
-        "play_pause": ">||",
-        "swipe_up": "^^",
-        "swipe_down": "vv",
-        "swipe_left": "<<",
-        "swipe_right": ">>",
-    }
+    """Execute une etape de scenario (deja validee, voir load_validated_scenarios)."""
+    action = step.action
+    repeat = step.repeat
+    delay = step.delay
+    inter_delay = delay if step.inter_delay is None else step.inter_delay
+
+    if dispatch is None:
+        dispatch = build_action_dispatch(atv)
+    action_fn, label = dispatch.get(action, (None, ""))
+
+    if action_fn is not None and repeat > 1:
+        if step.burst:
+            # Toutes les repetitions partent ensemble
+            logger.info(f"  [{num}] {label} (x{repeat}, rafale)")
+            await asyncio.gather(*(action_fn() for _ in range(repeat)))
+        elif step.pipeline or (step.pipeline is None and action in PIPELINE_ACTIONS):
+            await _pipeline_presses(action_fn, label, num, repeat, inter_delay)
+        else:
+            for i in range(repeat):
+                if i and inter_delay > 0:
+                    await asyncio.sleep(inter_delay)
+                logger.info(f"  [{num}] {label} ({i + 1}/{repeat})")
+                await action_fn()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return True
 
     for i in range(repeat):
         info = f" ({i + 1}/{repeat})" if repeat > 1 else ""
 
-        if action == "launch":
-            app = step.get("app")
-            if not app:
-                logger.error(f"  [{num}] Parametre 'app' manquant")
-                return False
-            logger.info(f"  [{num}] Lancement {app}...{info}")
-            await launch_app(atv, app)
-
-        elif action == "wait":
-            secs = step.get("seconds", 1)
-            logger.info(f"  [{num}] Attente {secs}s...{info}")
-            await asyncio.sleep(secs)
-
-        elif action in nav_actions:
-            logger.info(f"  [{num}] {symbols.get(action, '')} {action.capitalize()}{info}")
-            await nav_actions[action]()
+        if action_fn is not None:
+            logger.info(f"  [{num}] {label}{info}")
+            await action_fn()
             if delay > 0:
                 await asyncio.sleep(delay)
 
-        elif action in play_actions:
-            logger.info(f"  [{num}] {symbols.get(action, '')} {action.capitalize()}{info}")
-            await play_actions[action]()
-            if delay > 0:
-                await asyncio.sleep(delay)
+        elif action == "launch":
+            # Equivalent de apps.launch_app, sans coroutine intermediaire
+            from pyatv.const import FeatureName
 
-        elif action in SWIPE_GESTURES:
-            logger.info(f"  [{num}] {symbols.get(action, '')} {action.replace('_', ' ').title()}{info}")
-            start_x, start_y, end_x, end_y, duration = SWIPE_GESTURES[action]
-            await atv.touch.swipe(start_x, start_y, end_x, end_y, duration)
-            if delay > 0:
-                await asyncio.sleep(delay)
+            from .apps import get_bundle_id
+            from .connection import ensure_feature
 
-        elif action == "home_double":
-            logger.info(f"  [{num}] {symbols.get(action, '')} Home Double (App Switcher){info}")
-            await atv.remote_control.home()
-            await asyncio.sleep(0.15)  # 150ms entre les deux appuis
-            await atv.remote_control.home()
-            if delay > 0:
-                await asyncio.sleep(delay)
+            ensure_feature(atv, FeatureName.LaunchApp)
+            bundle_id = get_bundle_id(step.app, apps_config)
+            logger.info(f"  [{num}] Lancement {step.app} ({bundle_id})...{info}")
+            await atv.apps.launch_app(bundle_id)
+
+        elif action == "wait":
+            logger.info(f"  [{num}] Attente {step.seconds}s...{info}")
+            await asyncio.sleep(step.seconds)
 
         elif action == "scenario":
-            sub_name = step.get("name")
-            if not sub_name:
-                logger.error(f"  [{num}] Parametre 'name' manquant pour scenario")
-                return False
+            sub_name = step.name
 
             if depth >= MAX_SCENARIO_DEPTH:
                 logger.error(f"  [{num}] Profondeur max atteinte ({MAX_SCENARIO_DEPTH})")
                 return False
 
             if scenarios is None:
-                scenarios = load_scenarios(validate=False)
+                scenarios = load_validated_scenarios()
 
             if sub_name not in scenarios:
                 logger.error(f"  [{num}] Scenario '{sub_name}' non trouve")
                 return False
 
             logger.info(f"  [{num}] >> Sous-scenario: {sub_name}{info}")
-            sub_scenario = scenarios[sub_name]
-            sub_steps = sub_scenario.get("steps", [])
 
-            for j, sub_step in enumerate(sub_steps, 1):
-                if not await execute_step(atv, sub_step, j, scenarios, depth + 1):
+            for j, sub_step in enumerate(scenarios[sub_name].steps, 1):
+                if not await execute_step(
+                    atv, sub_step, j, scenarios, depth + 1, apps_config, dispatch
+                ):
                     return False
 
             logger.info(f"  [{num}] << Fin sous-scenario: {sub_name}")
@@ -197,7 +292,7 @@ async def execute_step(
 async def run_scenario(atv: AppleTV, name: str) -> bool:
     """Execute un scenario."""
     try:
-        scenarios = load_scenarios()
+        scenarios = load_validated_scenarios()
     except ValidationError as e:
         logger.error(f"Erreur de validation: {e}")
         return False
@@ -210,15 +305,23 @@ async def run_scenario(atv: AppleTV, name: str) -> bool:
         return False
 
     scenario = scenarios[name]
-    desc = scenario.get("description", "-")
-    steps = scenario.get("steps", [])
+    desc = scenario.description or "-"
+    steps = scenario.steps
 
     logger.info(f"\n> Execution: {name}")
     logger.info(f"  {desc}")
     logger.info(f"  {len(steps)} etape(s)\n")
 
+    from .apps import load_apps_config
+
+    # Prepare une seule fois pour toutes les etapes
+    apps_config = load_apps_config()
+    dispatch = build_action_dispatch(atv)
+
     for i, step in enumerate(steps, 1):
-        if not await execute_step(atv, step, i, scenarios, depth=0):
+        if not await execute_step(
+            atv, step, i, scenarios, depth=0, apps_config=apps_config, dispatch=dispatch
+        ):
             logger.error(f"\n[X] Echec a l'etape {i}")
             return False
 
@@ -3,23 +3,40 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from datetime import datetime
+import heapq
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
+from pyatv.exceptions import ConnectionFailedError, ConnectionLostError
+from pyatv.interface import AppleTV, DeviceListener
+
+from .apps import clear_app_list
 from .config import (
     SCHEDULE_FILE,
     SCHEDULER_INTERVAL,
+    SCHEDULER_SCAN_TTL,
     WEEKDAY_NAMES,
     load_json,
     logger,
     save_json,
 )
-from .connection import connect_atv, scan_devices, select_device
+from .connection import (
+    clear_feature_cache,
+    close_atv,
+    open_atv,
+    scan_devices,
+    scan_known_devices,
+    select_device,
+)
 from .exceptions import DeviceNotFoundError, FeatureNotAvailableError
 from .models import ValidationError, validate_schedules
 from .scenarios import load_scenarios, run_scenario
 
+# Masque des 7 jours (planification sans restriction de jours)
+ALL_DAYS_MASK = 0x7F
+
 
 @dataclass
 class ScheduleEntry:
@@ -31,6 +48,10 @@ class ScheduleEntry:
     minute: int
     weekdays: Optional[list[int]] = None
     enabled: bool = True
+    # Precalcules a l'initialisation : minute du jour et masque des jours
+    # autorises (bit d = jour d, dimanche=0)
+    _fire_key: int = field(init=False, repr=False, compare=False)
+    _day_mask: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Valide les champs apres initialisation."""
@@ -43,6 +64,12 @@ class ScheduleEntry:
             if invalid:
                 raise ValueError(f"weekdays doit etre entre 0-6, invalides: {invalid}")
 
+        self._fire_key = self.hour * 60 + self.minute
+        if self.weekdays is None:
+            self._day_mask = ALL_DAYS_MASK
+        else:
+            self._day_mask = sum(1 << d for d in set(self.weekdays))
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ScheduleEntry:
         """Cree une entree depuis un dictionnaire."""
@@ -68,17 +95,35 @@ class ScheduleEntry:
             result["weekdays"] = self.weekdays
         return result
 
-    def should_run_now(self) -> bool:
-        """Verifie si cette planification doit s'executer maintenant."""
-        now = datetime.now()
+    def should_run_now(
+        self, now_key: Optional[int] = None, day_key: Optional[int] = None
+    ) -> bool:
+        """Verifie si cette planification doit s'executer maintenant.
 
-        # Verifier le jour (Python: lundi=0, notre format: dimanche=0)
-        if self.weekdays is not None:
-            current_day = (now.weekday() + 1) % 7
-            if current_day not in self.weekdays:
-                return False
+        Args:
+            now_key: Minute du jour (heure * 60 + minute), voir time_keys.
+            day_key: Jour de la semaine (dimanche=0).
+            Sans arguments, l'heure courante est utilisee.
+        """
+        if now_key is None or day_key is None:
+            now_key, day_key = time_keys(datetime.now())
+
+        return self._fire_key == now_key and (self._day_mask >> day_key) & 1 == 1
+
+    def next_fire(self, after: datetime) -> datetime:
+        """Retourne la prochaine execution a partir de `after` (inclus)."""
+        fire = after.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if fire < after:
+            fire += timedelta(days=1)
+
+        if self._day_mask != ALL_DAYS_MASK:
+            # Au plus 7 jours
+            for _ in range(7):
+                if (self._day_mask >> time_keys(fire)[1]) & 1:
+                    break
+                fire += timedelta(days=1)
 
-        return now.hour == self.hour and now.minute == self.minute
+        return fire
 
     @property
     def time_str(self) -> str:
@@ -93,6 +138,15 @@ class ScheduleEntry:
         return ", ".join(WEEKDAY_NAMES[d] for d in sorted(self.weekdays))
 
 
+def time_keys(now: datetime) -> tuple[int, int]:
+    """Retourne (minute du jour, jour de la semaine) pour should_run_now.
+
+    Python numerote les jours a partir du lundi (0), notre format a partir
+    du dimanche (0).
+    """
+    return now.hour * 60 + now.minute, (now.weekday() + 1) % 7
+
+
 def load_schedules(*, validate: bool = True) -> list[ScheduleEntry]:
     """Charge les planifications depuis schedule.json.
 
@@ -119,6 +173,18 @@ def save_schedules(schedules: list[ScheduleEntry]) -> None:
     save_json(SCHEDULE_FILE, data)
 
 
+def add_schedules(entries: list[ScheduleEntry]) -> None:
+    """Ajoute plusieurs planifications en une seule sauvegarde."""
+    schedules = load_schedules(validate=False)
+    schedules.extend(entries)
+    save_schedules(schedules)
+
+
+def add_schedule(entry: ScheduleEntry) -> None:
+    """Ajoute une planification."""
+    add_schedules([entry])
+
+
 def show_schedules() -> None:
     """Affiche les planifications."""
     try:
@@ -128,26 +194,29 @@ def show_schedules() -> None:
         return
 
     if not schedules:
-        logger.info("Aucune planification configuree.")
-        logger.info(f"\nFichier: {SCHEDULE_FILE}")
-        logger.info("\nPour ajouter: python -m apple_tv schedule-add")
+        logger.info(
+            "Aucune planification configuree.\n"
+            f"\nFichier: {SCHEDULE_FILE}\n"
+            "\nPour ajouter: python -m apple_tv schedule-add"
+        )
         return
 
-    logger.info("Planifications configurees:\n")
+    lines = ["Planifications configurees:\n"]
 
     for i, entry in enumerate(schedules):
         status_icon = "+" if entry.enabled else "-"
         status_text = "ON" if entry.enabled else "OFF"
 
-        logger.info(f"[{i}] {status_icon} {entry.scenario}")
-        logger.info(f"    Appareil: {entry.device}")
-        logger.info(f"    Heure:    {entry.time_str}")
-        logger.info(f"    Jours:    {entry.weekdays_str}")
-        logger.info(f"    Statut:   {status_text}")
-        logger.info("")
+        lines.append(f"[{i}] {status_icon} {entry.scenario}")
+        lines.append(f"    Appareil: {entry.device}")
+        lines.append(f"    Heure:    {entry.time_str}")
+        lines.append(f"    Jours:    {entry.weekdays_str}")
+        lines.append(f"    Statut:   {status_text}")
+        lines.append("")
 
-    logger.info(f"Total: {len(schedules)} planification(s)")
-    logger.info(f"Fichier: {SCHEDULE_FILE}")
+    lines.append(f"Total: {len(schedules)} planification(s)")
+    lines.append(f"Fichier: {SCHEDULE_FILE}")
+    logger.info("\n".join(lines))
 
 
 def add_schedule_interactive() -> None:
@@ -225,9 +294,7 @@ def add_schedule_interactive() -> None:
         enabled=True,
     )
 
-    schedules = load_schedules(validate=False)
-    schedules.append(entry)
-    save_schedules(schedules)
+    add_schedule(entry)
 
     logger.info(f"\n[OK] Planification ajoutee!")
     logger.info(f"  Scenario: {scenario_name}")
@@ -255,59 +322,290 @@ def remove_schedule(index: int) -> bool:
     return True
 
 
-async def execute_scheduled_entry(entry: ScheduleEntry) -> bool:
-    """Execute une planification."""
-    try:
-        devices = await scan_devices()
-        device = select_device(devices, entry.device)
+# Dernier scan complet du scheduler : (date monotone, appareils)
+_last_scan: Optional[tuple[float, list[Any]]] = None
 
-        async with connect_atv(device) as atv:
-            return await run_scenario(atv, entry.scenario)
 
-    except (DeviceNotFoundError, FeatureNotAvailableError) as e:
-        logger.error(f"  Erreur: {e}")
-        return False
+async def _scan_for_schedules(device_names: list[str]) -> list[Any]:
+    """Scan partage par les planifications dues (reutilise pendant SCHEDULER_SCAN_TTL)."""
+    global _last_scan
+
+    if _last_scan is not None and time.monotonic() - _last_scan[0] < SCHEDULER_SCAN_TTL:
+        return _last_scan[1]
+
+    if device_names:
+        # Appareils deja utilises : scans unicast en parallele. Resultat
+        # partiel, donc non memorise pour les autres appareils.
+        found = await asyncio.gather(*(scan_known_devices(n) for n in device_names))
+        if all(found):
+            return [device for devices in found for device in devices]
+
+    # Un seul appareil attendu : le scan peut s'arreter des qu'il repond
+    name = device_names[0] if len(device_names) == 1 else None
+    devices = await scan_devices(name=name)
+    # Un scan arrete au premier appareil ne vaut pas pour les autres
+    if name is None:
+        _last_scan = (time.monotonic(), devices)
+    return devices
+
+
+async def _warm_up_scan() -> None:
+    """Scan initial du scheduler : les premieres echeances n'ont pas a scanner."""
+    try:
+        await _scan_for_schedules([])
     except Exception as e:
-        logger.error(f"  Erreur inattendue: {e}")
-        return False
+        logger.error(f"  Erreur de scan: {e}")
+
+
+# Erreurs de connexion justifiant une reconnexion
+_CONNECTION_ERRORS = (ConnectionLostError, ConnectionFailedError, OSError, asyncio.TimeoutError)
+
+# Connexions gardees ouvertes entre deux executions : appareil (casefold) -> connexion
+_connections: dict[str, AppleTV] = {}
+
+
+class _PoolListener(DeviceListener):
+    """Retire une connexion du pool quand elle est perdue ou fermee."""
+
+    def __init__(self, key: str, atv: AppleTV) -> None:
+        self._key = key
+        self._atv = atv
+
+    def connection_lost(self, exception: Exception) -> None:
+        logger.warning(f"Connexion perdue avec {self._key}: {exception}")
+        self._forget()
+
+    def connection_closed(self) -> None:
+        self._forget()
+
+    def _forget(self) -> None:
+        # Une connexion remplacee depuis ne doit pas retirer la nouvelle
+        if _connections.get(self._key) is self._atv:
+            del _connections[self._key]
+
+
+def _drop_connection(key: str) -> None:
+    """Ferme et oublie la connexion d'un appareil."""
+    atv = _connections.pop(key, None)
+    if atv is not None:
+        close_atv(atv)
+
+
+def close_scheduler_connections() -> None:
+    """Ferme toutes les connexions gardees par le scheduler."""
+    for key in list(_connections):
+        _drop_connection(key)
+
+
+async def _run_device_group(
+    key: str, group: list[ScheduleEntry], devices: list[Any]
+) -> None:
+    """Execute les scenarios d'un appareil sur sa connexion persistante.
+
+    En cas d'erreur de connexion, reconnecte une fois et reprend au scenario
+    qui a echoue.
+    """
+    done = 0
+    for attempt in range(2):
+        try:
+            atv = _connections.get(key)
+            if atv is None:
+                if not devices:
+                    devices = await _scan_for_schedules([group[0].device])
+                device = select_device(devices, group[0].device)
+                atv = await open_atv(device)
+                atv.listener = _PoolListener(key, atv)
+                _connections[key] = atv
+            else:
+                # Connexion reutilisee : fonctionnalites et applications ont
+                # pu changer depuis l'execution precedente
+                clear_feature_cache(atv)
+                clear_app_list(atv)
+
+            for entry in group[done:]:
+                await run_scenario(atv, entry.scenario)
+                done += 1
+            return
+
+        except _CONNECTION_ERRORS as e:
+            _drop_connection(key)
+            if attempt:
+                logger.error(f"  Erreur de connexion: {e}")
+            else:
+                logger.warning(f"  Connexion interrompue ({e}), reconnexion...")
+        except (DeviceNotFoundError, FeatureNotAvailableError) as e:
+            logger.error(f"  Erreur: {e}")
+            return
+        except Exception as e:
+            logger.error(f"  Erreur inattendue: {e}")
+            return
+
+
+async def _prepare_group(
+    entries: list[ScheduleEntry],
+) -> tuple[dict[str, list[ScheduleEntry]], list[Any]]:
+    """Regroupe les planifications par appareil et scanne ceux sans connexion."""
+    by_device: dict[str, list[ScheduleEntry]] = {}
+    for entry in entries:
+        by_device.setdefault(entry.device.casefold(), []).append(entry)
+
+    devices: list[Any] = []
+    missing = [group[0].device for key, group in by_device.items() if key not in _connections]
+    if missing:
+        try:
+            devices = await _scan_for_schedules(missing)
+        except Exception as e:
+            logger.error(f"  Erreur de scan: {e}")
+
+    return by_device, devices
+
+
+class _DeviceWorkers:
+    """Une file et une tache par appareil pour le scheduler.
+
+    La boucle du scheduler depose les planifications dues sans attendre leur
+    fin : un scenario long sur un appareil ne retarde ni les autres
+    appareils ni les echeances suivantes.
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[str, asyncio.Queue[tuple[list[ScheduleEntry], list[Any]]]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def submit(self, entries: list[ScheduleEntry]) -> None:
+        """Scanne si besoin puis confie chaque appareil a sa tache."""
+        by_device, devices = await _prepare_group(entries)
+        for key, group in by_device.items():
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = asyncio.Queue()
+                self._tasks.append(asyncio.create_task(self._work(key, queue)))
+            queue.put_nowait((group, devices))
+
+    async def _work(
+        self, key: str, queue: asyncio.Queue[tuple[list[ScheduleEntry], list[Any]]]
+    ) -> None:
+        while True:
+            group, devices = await queue.get()
+            try:
+                await _run_device_group(key, group, devices)
+            finally:
+                queue.task_done()
+
+    async def join(self) -> None:
+        """Attend que toutes les planifications deposees soient executees."""
+        await asyncio.gather(*(queue.join() for queue in self._queues.values()))
+
+    async def close(self) -> None:
+        """Arrete les taches."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._queues.clear()
+
+
+def _schedule_file_key() -> Optional[tuple[int, int]]:
+    """Version de schedule.json (None si absent)."""
+    try:
+        st = SCHEDULE_FILE.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _build_schedule_heap(
+    after: datetime,
+) -> list[tuple[datetime, int, ScheduleEntry]]:
+    """Construit le tas (prochaine execution, index, entree) des planifications actives."""
+    try:
+        schedules = load_schedules()
+    except ValidationError as e:
+        logger.error(f"Erreur de validation: {e}")
+        return []
+
+    heap = [
+        (entry.next_fire(after), i, entry)
+        for i, entry in enumerate(schedules)
+        if entry.enabled and entry.weekdays != []  # Liste vide : jamais
+    ]
+    heapq.heapify(heap)
+    return heap
 
 
 async def run_scheduler() -> None:
-    """Boucle principale du scheduler."""
+    """Boucle principale du scheduler.
+
+    Les planifications sont rangees dans un tas par date de prochaine
+    execution : le scheduler dort jusqu'a la prochaine echeance (au plus
+    SCHEDULER_INTERVAL, pour prendre en compte les modifications de
+    schedule.json a chaud).
+    """
     logger.info("=" * 50)
     logger.info("Scheduler Apple TV demarre")
     logger.info("=" * 50)
     logger.info(f"Fichier: {SCHEDULE_FILE}")
     logger.info("Ctrl+C pour arreter\n")
 
-    last_check: Optional[tuple[int, int]] = None
+    workers = _DeviceWorkers()
+    try:
+        await _scheduler_loop(workers)
+    finally:
+        await workers.close()
+        close_scheduler_connections()
+
+
+async def _scheduler_loop(workers: _DeviceWorkers) -> None:
+    """Attend et depose les planifications dues (voir run_scheduler)."""
+    heap: list[tuple[datetime, int, ScheduleEntry]] = []
+    file_key: Optional[tuple[int, int]] = None
+    first_load = True
+    # Les executions anterieures a cette date ont deja eu lieu
+    resume_from = datetime.min
 
     while True:
+        # Une seule lecture de l'horloge par iteration
         now = datetime.now()
-        current_minute = (now.hour, now.minute)
 
-        # Eviter les executions multiples dans la meme minute
-        if current_minute != last_check:
-            last_check = current_minute
-
-            # Recharger les planifications (modifs a chaud)
-            try:
-                schedules = load_schedules()
-            except ValidationError as e:
-                logger.error(f"Erreur de validation: {e}")
-                schedules = []
-
-            for entry in schedules:
-                if not entry.enabled:
-                    continue
-
-                if entry.should_run_now():
-                    logger.info(
-                        f"[{now.strftime('%H:%M:%S')}] "
-                        f"Execution: {entry.scenario} sur {entry.device}"
-                    )
-                    await execute_scheduled_entry(entry)
-
-        # Attendre la prochaine minute (calcul atomique pour eviter race condition)
-        sleep_seconds = SCHEDULER_INTERVAL - datetime.now().second
-        await asyncio.sleep(max(1, sleep_seconds))
+        # Recharger les planifications seulement si le fichier a change
+        key = _schedule_file_key()
+        if first_load or key != file_key:
+            file_key = key
+            # La minute en cours reste eligible si elle n'a pas ete executee
+            minute_start = now.replace(second=0, microsecond=0)
+            # Lecture du fichier hors de la boucle d'evenements (les
+            # scenarios en cours continuent pendant le rechargement)
+            load = asyncio.to_thread(_build_schedule_heap, max(resume_from, minute_start))
+            if first_load:
+                # Au demarrage, le scan reseau se fait pendant la lecture
+                heap, _ = await asyncio.gather(load, _warm_up_scan())
+            else:
+                heap = await load
+            first_load = False
+            # Le chargement a pu prendre du temps : relire l'horloge
+            continue
+
+        if heap and heap[0][0] <= now:
+            # Toutes les planifications dues sont executees ensemble
+            due: list[ScheduleEntry] = []
+            while heap and heap[0][0] <= now:
+                fire_at, i, entry = heapq.heappop(heap)
+                logger.info(
+                    f"[{now.strftime('%H:%M:%S')}] "
+                    f"Execution: {entry.scenario} sur {entry.device}"
+                )
+                due.append(entry)
+
+                next_after = fire_at + timedelta(minutes=1)
+                resume_from = max(resume_from, next_after)
+                heapq.heappush(heap, (entry.next_fire(next_after), i, entry))
+
+            await workers.submit(due)
+            continue
+
+        # Attente plafonnee : un changement d'heure systeme est rattrape au
+        # plus tard apres SCHEDULER_INTERVAL
+        sleep_seconds = float(SCHEDULER_INTERVAL)
+        if heap:
+            sleep_seconds = min(sleep_seconds, (heap[0][0] - now).total_seconds())
+        await asyncio.sleep(sleep_seconds)
@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Callable
 
 from aiohttp import web
 
-from .config import HTTP_REQUEST_TIMEOUT, SERVER_PORT, logger
+from .config import HTTP_REQUEST_TIMEOUT, SERVER_PORT, _json_loads, logger
 from .connection import connect_atv, scan_devices, select_device
 from .exceptions import AppleTVError
+from .models import ValidationError, validate_schedules
 from .scenarios import load_scenarios, run_scenario
+from .scheduler import ScheduleEntry, add_schedules
 
 
 async def http_health(request: web.Request) -> web.Response:
@@ -26,7 +27,7 @@ async def http_list_scenarios(request: web.Request) -> web.Response:
 
 async def _execute_scenario(name: str, device_name: str) -> dict:
     """Execute un scenario (logique separee pour le timeout)."""
-    devices = await scan_devices()
+    devices = await scan_devices(name=device_name)
     device = select_device(devices, device_name)
 
     async with connect_atv(device) as atv:
@@ -79,6 +80,46 @@ async def http_run_scenario(request: web.Request) -> web.Response:
         )
 
 
+async def http_add_schedules(request: web.Request) -> web.Response:
+    """Ajoute une ou plusieurs planifications en une seule requete.
+
+    Le corps est soit une entree seule, soit {"schedules": [...]}
+    (meme format que schedule.json).
+    """
+    # Corps lu une fois et decode par orjson si disponible
+    body = await request.read()
+    try:
+        data = _json_loads(body)
+    except ValueError:
+        return web.json_response(
+            {"success": False, "error": "JSON invalide"},
+            status=400,
+        )
+
+    if not isinstance(data, dict):
+        return web.json_response(
+            {"success": False, "error": "Objet JSON attendu"},
+            status=400,
+        )
+
+    if "schedules" not in data:
+        data = {"schedules": [data]}
+
+    try:
+        validate_schedules(data)
+    except ValidationError as e:
+        return web.json_response(
+            {"success": False, "error": str(e)},
+            status=400,
+        )
+
+    entries = [ScheduleEntry.from_dict(entry) for entry in data["schedules"]]
+    add_schedules(entries)
+    logger.info(f"{len(entries)} planification(s) ajoutee(s) via HTTP")
+
+    return web.json_response({"success": True, "added": len(entries)})
+
+
 async def http_shutdown(request: web.Request) -> web.Response:
     """Arrete le serveur proprement."""
     logger.info("Arret du serveur demande...")
@@ -91,36 +132,20 @@ async def http_shutdown(request: web.Request) -> web.Response:
     return web.json_response({"status": "shutting_down"})
 
 
-@web.middleware
-async def timeout_middleware(
-    request: web.Request,
-    handler: Callable[[web.Request], web.Response]
-) -> web.Response:
-    """Middleware pour appliquer un timeout global aux requetes."""
-    try:
-        return await asyncio.wait_for(
-            handler(request),
-            timeout=HTTP_REQUEST_TIMEOUT + 10
-        )
-    except asyncio.TimeoutError:
-        return web.json_response(
-            {"success": False, "error": "Request timeout"},
-            status=504,
-        )
-
-
 async def run_server(port: int = SERVER_PORT) -> None:
     """Lance le serveur HTTP."""
     app = web.Application(
-        middlewares=[timeout_middleware],
         client_max_size=1024 * 100,  # Limite 100KB par requete
     )
     app.router.add_get("/health", http_health)
     app.router.add_get("/scenarios", http_list_scenarios)
     app.router.add_post("/scenario/{name}", http_run_scenario)
+    app.router.add_post("/schedule", http_add_schedules)
     app.router.add_post("/shutdown", http_shutdown)
 
-    runner = web.AppRunner(app)
+    # Le handler est annule si le client se deconnecte ; le timeout des
+    # scenarios est gere dans http_run_scenario
+    runner = web.AppRunner(app, handler_cancellation=True)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
 
@@ -129,6 +154,7 @@ async def run_server(port: int = SERVER_PORT) -> None:
     print("  GET  /health")
     print("  GET  /scenarios")
     print("  POST /scenario/{name}?device=Salon")
+    print("  POST /schedule")
     print("  POST /shutdown")
     print(f"\nTimeout requetes: {HTTP_REQUEST_TIMEOUT}s")
     print("Ctrl+C pour arreter")
@@ -1,20 +1,17 @@
 """Fixtures pytest."""
 
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
 
 @pytest.fixture
-def temp_dir():
-    """Cree un repertoire temporaire pour les tests."""
-    dirpath = tempfile.mkdtemp()
-    yield Path(dirpath)
-    shutil.rmtree(dirpath, ignore_errors=True)
+def temp_dir(tmp_path):
+    """Repertoire temporaire pour les tests (nettoye par pytest)."""
+    return tmp_path
 
 
-@pytest.fixture
+# Donnees partagees par toute la session : les tests ne doivent pas les
+# modifier (les validateurs exigent de vrais dict, pas de MappingProxyType).
+@pytest.fixture(scope="session")
 def sample_scenarios():
     """Scenarios valides pour les tests."""
     return {
@@ -37,7 +34,7 @@ def sample_scenarios():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_schedules():
     """Planifications valides pour les tests."""
     return {
@@ -0,0 +1,111 @@
+"""Tests pour apple_tv.apps (configuration et generation des alias)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from apple_tv import apps
+from apple_tv.apps import _make_alias, load_apps_config, sync_apps_config
+from apple_tv.config import DEFAULT_APPS_CONFIG, load_json
+
+
+class TestMakeAlias:
+    """Tests pour _make_alias."""
+
+    @pytest.mark.parametrize(
+        ("name", "alias"),
+        [
+            ("Netflix", "netflix"),
+            ("Apple TV", "apple_tv"),
+            ("Disney+", "disney"),
+            ("Canal+ - Live", "canal___live"),
+            ("Téléchargé", "téléchargé"),
+        ],
+    )
+    def test_alias(self, name, alias):
+        """Separateurs remplaces, caracteres speciaux supprimes, accents gardes."""
+        assert _make_alias(name) == alias
+
+
+class TestLoadAppsConfig:
+    """Tests pour load_apps_config."""
+
+    def test_missing_file_returns_defaults_without_writing(self, tmp_path, monkeypatch):
+        """Sans apps.json : configuration par defaut, aucun fichier cree."""
+        path = tmp_path / "apps.json"
+        monkeypatch.setattr(apps, "APPS_CONFIG_FILE", path)
+
+        config = load_apps_config()
+        config["autre"] = "com.example.app"
+
+        assert not path.exists()
+        assert "autre" not in DEFAULT_APPS_CONFIG
+
+
+class FakeAppleTV:
+    """Connexion simulee exposant une liste d'applications."""
+
+    def __init__(self, names):
+        self.fetches = 0
+
+        async def app_list():
+            self.fetches += 1
+            return [SimpleNamespace(name=n, identifier=f"com.example.{i}") for i, n in enumerate(names)]
+
+        self.apps = SimpleNamespace(app_list=app_list)
+        self.features = SimpleNamespace(in_state=lambda state, feature: True)
+
+
+class TestSyncAppsConfig:
+    """Tests pour sync_apps_config."""
+
+    async def test_duplicate_aliases_get_increasing_suffixes(self, tmp_path, monkeypatch):
+        """Les alias en double recoivent _1, _2... sans collision."""
+        path = tmp_path / "apps.json"
+        monkeypatch.setattr(apps, "APPS_CONFIG_FILE", path)
+        monkeypatch.setattr(apps, "DEFAULT_APPS_CONFIG", {"demo_1": "com.other"})
+
+        added = await sync_apps_config(FakeAppleTV(["Demo", "Demo", "Demo", "Demo"]))
+
+        config = load_json(path)
+        assert added == 4
+        assert config == {
+            "demo_1": "com.other",
+            "demo": "com.example.0",
+            "demo_2": "com.example.1",
+            "demo_3": "com.example.2",
+            "demo_4": "com.example.3",
+        }
+
+
+class TestAppListCache:
+    """Tests pour la liste des applications memorisee par connexion."""
+
+    async def test_reused_within_ttl(self):
+        """Deux commandes rapprochees : un seul appel reseau."""
+        atv = FakeAppleTV(["Demo"])
+
+        await apps._get_app_list(atv)
+        await apps._get_app_list(atv)
+
+        assert atv.fetches == 1
+
+    async def test_refetched_after_ttl(self, monkeypatch):
+        """Passe APP_LIST_TTL, la liste est redemandee a l'appareil."""
+        atv = FakeAppleTV(["Demo"])
+        monkeypatch.setattr(apps, "APP_LIST_TTL", 0)
+
+        await apps._get_app_list(atv)
+        await apps._get_app_list(atv)
+
+        assert atv.fetches == 2
+
+    async def test_refetched_after_clear(self):
+        """clear_app_list force un nouvel appel reseau."""
+        atv = FakeAppleTV(["Demo"])
+
+        await apps._get_app_list(atv)
+        apps.clear_app_list(atv)
+        await apps._get_app_list(atv)
+
+        assert atv.fetches == 2
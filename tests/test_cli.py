@@ -0,0 +1,185 @@
+"""Tests pour apple_tv.cli (selection de l'appareil)."""
+
+from types import SimpleNamespace
+
+import pytest
+import typer
+
+from apple_tv import connection, daemon
+from apple_tv.cli import utils
+from apple_tv.cli.utils import forward_to_daemon, require_device
+
+
+def make_device(name, address="10.0.0.1", identifier="A"):
+    """Configuration d'appareil simulee."""
+    return SimpleNamespace(name=name, address=address, identifier=identifier)
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Scans simules ; les appareils memorises sont enregistres."""
+    scans = {
+        "last": [], "targeted": [], "known": [], "full": [],
+        "calls": [], "remembered": [], "creds": 0,
+    }
+
+    def fake_load_credentials():
+        scans["creds"] += 1
+        return {}
+
+    async def fake_last(timeout=1):
+        scans["calls"].append("last")
+        return scans["last"]
+
+    async def fake_targeted(selector, timeout=1):
+        scans["calls"].append(("targeted", selector))
+        return scans["targeted"]
+
+    async def fake_known(name, timeout=1):
+        scans["calls"].append(("known", name))
+        return scans["known"]
+
+    async def fake_full(timeout=5, *, identifier=None, name=None):
+        scans["calls"].append(("full", name))
+        return scans["full"]
+
+    monkeypatch.setattr(connection, "scan_last_device", fake_last)
+    monkeypatch.setattr(connection, "scan_targeted", fake_targeted)
+    monkeypatch.setattr(connection, "scan_known_devices", fake_known)
+    monkeypatch.setattr(connection, "scan_devices", fake_full)
+    monkeypatch.setattr(connection, "remember_device", scans["remembered"].append)
+    monkeypatch.setattr(connection, "load_credentials", fake_load_credentials)
+    monkeypatch.setattr(utils, "get_default_device", lambda: None)
+    return scans
+
+
+class TestRequireDevice:
+    """Tests pour require_device."""
+
+    def test_last_device_skips_full_scan(self, scans):
+        """Sans nom : le dernier appareil repond, pas de scan complet."""
+        salon = make_device("Salon")
+        scans["last"] = [salon]
+
+        with require_device() as selected:
+            assert selected is salon
+
+        assert scans["calls"] == ["last"]
+        assert scans["remembered"] == [salon]
+
+    def test_full_scan_when_last_device_silent(self, scans):
+        """Dernier appareil injoignable : scan complet."""
+        salon = make_device("Salon")
+        scans["full"] = [salon]
+
+        with require_device() as selected:
+            assert selected is salon
+
+        assert scans["calls"] == ["last", ("full", None)]
+
+    def test_ip_selector_scans_target(self, scans):
+        """-d avec une adresse IP : scan unicast de cette adresse."""
+        salon = make_device("Salon", address="10.0.0.7")
+        scans["targeted"] = [salon]
+
+        with require_device("10.0.0.7") as selected:
+            assert selected is salon
+
+        assert scans["calls"] == [("targeted", "10.0.0.7")]
+
+    def test_known_name_skips_full_scan(self, scans):
+        """Nom deja utilise : scan unicast de ses adresses memorisees."""
+        salon = make_device("Salon")
+        scans["known"] = [salon]
+
+        with require_device("Salon") as selected:
+            assert selected is salon
+
+        assert scans["calls"] == [("known", "Salon")]
+
+    def test_refresh_forces_full_scan(self, scans):
+        """--refresh : les appareils memorises sont ignores."""
+        salon = make_device("Salon")
+        scans["known"] = [salon]
+        scans["full"] = [salon]
+
+        with require_device("Salon", refresh=True) as selected:
+            assert selected is salon
+
+        assert scans["calls"] == [("full", "Salon")]
+
+    def test_credentials_loaded_during_scan(self, scans):
+        """credentials.json est lu pendant le scan."""
+        scans["last"] = [make_device("Salon")]
+
+        with require_device():
+            pass
+
+        assert scans["creds"] == 1
+
+    def test_unknown_name_exits(self, scans):
+        """Nom introuvable : sortie en erreur, rien n'est memorise."""
+        scans["full"] = [make_device("Salon")]
+
+        with pytest.raises(typer.Exit):
+            with require_device("Cuisine"):
+                pass
+
+        assert scans["remembered"] == []
+
+
+@pytest.fixture
+def daemon_socket(tmp_path, monkeypatch):
+    """Socket de daemon simule ; les commandes transmises sont enregistrees."""
+    socket_path = tmp_path / "atv.sock"
+    sent = SimpleNamespace(commands=[], response={"ok": True, "output": ["ok"]})
+
+    async def fake_send(command, params):
+        sent.commands.append((command, params))
+        return sent.response
+
+    monkeypatch.setattr(utils, "DAEMON_SOCKET", socket_path)
+    monkeypatch.setattr(daemon, "send_command", fake_send)
+    sent.path = socket_path
+    return sent
+
+
+class TestForwardToDaemon:
+    """Tests pour forward_to_daemon."""
+
+    def test_no_socket(self, daemon_socket):
+        """Pas de daemon : la commande est executee localement."""
+        assert forward_to_daemon("on", {}, None) is False
+        assert daemon_socket.commands == []
+
+    def test_forwarded(self, daemon_socket):
+        """Daemon lance : la commande lui est transmise."""
+        daemon_socket.path.touch()
+
+        assert forward_to_daemon("launch", {"app": "netflix"}, None) is True
+        assert daemon_socket.commands == [("launch", {"app": "netflix"})]
+
+    def test_explicit_device_not_forwarded(self, daemon_socket):
+        """Avec -d, la commande n'est pas transmise."""
+        daemon_socket.path.touch()
+
+        assert forward_to_daemon("on", {}, "Salon") is False
+        assert daemon_socket.commands == []
+
+    def test_daemon_error_exits(self, daemon_socket):
+        """Erreur du daemon : sortie en erreur."""
+        daemon_socket.path.touch()
+        daemon_socket.response = {"ok": False, "error": "boom"}
+
+        with pytest.raises(typer.Exit):
+            forward_to_daemon("on", {}, None)
+
+
+class TestEntryPoints:
+    """Tests des points d'entree."""
+
+    def test_run_exported(self):
+        """apple-tv, apple_tv_power.py et python -m apple_tv utilisent run."""
+        from apple_tv.cli import main, run
+
+        assert callable(run) and callable(main)
@@ -1,11 +1,13 @@
 """Tests pour apple_tv.config."""
 
+import asyncio
 import json
 import os
 import pytest
 from pathlib import Path
 
-from apple_tv.config import load_json, save_json
+from apple_tv import config
+from apple_tv.config import enable_eager_tasks, load_json, save_json, save_json_async
 
 
 class TestLoadJson:
@@ -55,6 +57,62 @@ class TestLoadJson:
 
         assert result == []
 
+    def test_load_reflects_file_changes(self, temp_dir):
+        """Un fichier modifie sur disque est relu."""
+        filepath = temp_dir / "changing.json"
+        filepath.write_text('{"version": 1}')
+        assert load_json(filepath) == {"version": 1}
+
+        filepath.write_text('{"version": 2}')
+        stat = filepath.stat()
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_json(filepath) == {"version": 2}
+
+    def test_load_returns_independent_copies(self, temp_dir):
+        """Modifier le resultat n'affecte pas les lectures suivantes."""
+        filepath = temp_dir / "cached.json"
+        filepath.write_text('{"items": [1, 2]}')
+
+        first = load_json(filepath)
+        first["items"].append(3)
+
+        assert load_json(filepath) == {"items": [1, 2]}
+
+    def test_save_then_load_returns_new_content(self, temp_dir):
+        """save_json invalide le contenu memorise."""
+        filepath = temp_dir / "roundtrip.json"
+        save_json(filepath, {"a": 1})
+        assert load_json(filepath) == {"a": 1}
+
+        save_json(filepath, {"a": 2})
+
+        assert load_json(filepath) == {"a": 2}
+
+    def test_load_detects_size_change_with_same_mtime(self, temp_dir):
+        """Un changement de taille suffit a invalider le cache."""
+        filepath = temp_dir / "resized.json"
+        filepath.write_text('{"v": 1}')
+        mtime_ns = filepath.stat().st_mtime_ns
+        assert load_json(filepath) == {"v": 1}
+
+        filepath.write_text('{"v": 1000}')
+        os.utime(filepath, ns=(mtime_ns, mtime_ns))
+
+        assert load_json(filepath) == {"v": 1000}
+
+    def test_load_after_save_does_not_read_file(self, temp_dir, monkeypatch):
+        """save_json memorise le contenu ecrit."""
+        filepath = temp_dir / "primed.json"
+        save_json(filepath, {"a": 1})
+
+        def fail_read(self):
+            raise AssertionError("fichier relu")
+
+        monkeypatch.setattr(Path, "read_bytes", fail_read)
+
+        assert load_json(filepath) == {"a": 1}
+
 
 class TestSaveJson:
     """Tests pour save_json."""
@@ -133,3 +191,83 @@ class TestSaveJson:
         save_json(filepath, data)
 
         assert json.loads(filepath.read_text()) == data
+
+    def test_save_and_load_without_orjson(self, temp_dir, monkeypatch):
+        """Le module json standard est utilise si orjson est absent."""
+        monkeypatch.setattr(config, "orjson", None)
+        filepath = temp_dir / "stdlib.json"
+        data = {"message": "Café", "list": [1, 2]}
+
+        assert save_json(filepath, data) is True
+
+        assert load_json(filepath) == data
+        assert "Café" in filepath.read_text(encoding="utf-8")
+
+    def test_save_unchanged_data_skips_write(self, temp_dir, monkeypatch):
+        """Sauvegarder les memes donnees ne reecrit pas le fichier."""
+        filepath = temp_dir / "same.json"
+        save_json(filepath, {"a": 1})
+
+        writes = []
+        monkeypatch.setattr(config, "_write_atomic", lambda *a, **kw: writes.append(a) or True)
+
+        assert save_json(filepath, {"a": 1}) is True
+        assert writes == []
+
+    def test_save_after_external_change_writes(self, temp_dir):
+        """Un fichier modifie ailleurs est reecrit meme avec les memes donnees."""
+        filepath = temp_dir / "external.json"
+        save_json(filepath, {"a": 1})
+        filepath.write_text('{"a": 2, "b": 3}')
+
+        save_json(filepath, {"a": 1})
+
+        assert json.loads(filepath.read_text()) == {"a": 1}
+
+
+class TestSaveJsonAsync:
+    """Tests pour save_json_async."""
+
+    async def test_save_async_creates_file(self, temp_dir):
+        """Ecrit le fichier depuis l'executor."""
+        filepath = temp_dir / "async.json"
+
+        result = await save_json_async(filepath, {"async": True})
+
+        assert result is True
+        assert json.loads(filepath.read_text()) == {"async": True}
+
+    async def test_save_async_secure_sets_permissions(self, temp_dir):
+        """secure=True applique les permissions 600."""
+        filepath = temp_dir / "async_secure.json"
+
+        await save_json_async(filepath, {"secret": "data"}, secure=True)
+
+        assert oct(filepath.stat().st_mode)[-3:] == "600"
+
+
+class TestEnableEagerTasks:
+    """Tests pour enable_eager_tasks."""
+
+    async def test_unavailable(self, monkeypatch):
+        """Sans eager_task_factory (Python < 3.12), la boucle reste inchangee."""
+        monkeypatch.delattr(asyncio, "eager_task_factory", raising=False)
+        loop = asyncio.get_running_loop()
+        factory = loop.get_task_factory()
+
+        assert enable_eager_tasks() is False
+        assert loop.get_task_factory() is factory
+
+    async def test_installs_factory(self, monkeypatch):
+        """La fabrique de taches eager est installee sur la boucle courante."""
+        def fake_factory(loop, coro, **kwargs):
+            return asyncio.Task(coro, loop=loop, **kwargs)
+
+        monkeypatch.setattr(asyncio, "eager_task_factory", fake_factory, raising=False)
+        loop = asyncio.get_running_loop()
+        previous = loop.get_task_factory()
+        try:
+            assert enable_eager_tasks() is True
+            assert loop.get_task_factory() is fake_factory
+        finally:
+            loop.set_task_factory(previous)
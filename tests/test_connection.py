@@ -0,0 +1,244 @@
+"""Tests pour apple_tv.connection (selection d'appareil, appareils memorises, credentials)."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from pyatv.const import FeatureName
+
+from apple_tv import connection
+from apple_tv.connection import (
+    apply_credentials,
+    credentials_session,
+    is_direct_selector,
+    is_feature_available,
+    remember_device,
+    save_credentials,
+    scan_known_devices,
+    select_device,
+)
+from apple_tv.exceptions import DeviceNotFoundError
+
+
+def make_device(name, address="10.0.0.1", identifier=None):
+    """Cree un faux appareil avec les attributs utilises par select_device."""
+    return SimpleNamespace(name=name, address=address, identifier=identifier or name)
+
+
+@pytest.fixture
+def devices():
+    """Liste d'appareils pour les tests."""
+    return [
+        make_device("Salon 2", "10.0.0.2"),
+        make_device("Salon", "10.0.0.1"),
+        make_device("Chambre", "10.0.0.3"),
+    ]
+
+
+class TestSelectDevice:
+    """Tests pour select_device."""
+
+    def test_no_devices_raises(self):
+        """Liste vide leve DeviceNotFoundError."""
+        with pytest.raises(DeviceNotFoundError):
+            select_device([], "Salon")
+
+    def test_single_device_without_selector(self):
+        """Un seul appareil est selectionne automatiquement."""
+        device = make_device("Salon")
+
+        assert select_device([device]) is device
+
+    def test_select_by_index(self, devices):
+        """Selection par index."""
+        assert select_device(devices, 2).name == "Chambre"
+
+    def test_invalid_index_raises(self, devices):
+        """Index hors limites leve DeviceNotFoundError."""
+        with pytest.raises(DeviceNotFoundError):
+            select_device(devices, 5)
+
+    def test_exact_name_preferred(self, devices):
+        """Le nom exact est prioritaire sur une correspondance partielle."""
+        assert select_device(devices, "salon").address == "10.0.0.1"
+
+    def test_partial_name_match(self, devices):
+        """Selection par sous-chaine, insensible a la casse."""
+        assert select_device(devices, "CHAMB").name == "Chambre"
+
+    def test_select_by_address(self, devices):
+        """Selection par adresse IP exacte."""
+        assert select_device(devices, "10.0.0.3").name == "Chambre"
+
+    def test_unknown_name_raises(self, devices):
+        """Nom inconnu leve DeviceNotFoundError."""
+        with pytest.raises(DeviceNotFoundError):
+            select_device(devices, "Cuisine")
+
+    def test_interactive_choice(self, devices, monkeypatch):
+        """La saisie invalide est redemandee, puis l'index est applique."""
+        answers = iter(["abc", "9", "1"])
+        monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+
+        assert select_device(devices).name == "Salon"
+
+
+class TestIsDirectSelector:
+    """Tests pour is_direct_selector."""
+
+    @pytest.mark.parametrize(
+        "selector",
+        ["192.168.1.50", "AA:BB:CC:DD:EE:FF", "aabbccddeeff", "12345678-90AB-CDEF-1234-567890ABCDEF"],
+    )
+    def test_direct_selectors(self, selector):
+        """IP et identifiants sont reconnus."""
+        assert is_direct_selector(selector)
+
+    @pytest.mark.parametrize("selector", ["Salon", "Salon 2", "192.168.1"])
+    def test_name_selectors(self, selector):
+        """Les noms ne sont pas des selecteurs directs."""
+        assert not is_direct_selector(selector)
+
+
+class FakeAppleTV:
+    """Faux AppleTV dont les fonctionnalites disponibles peuvent changer."""
+
+    def __init__(self, available):
+        self.available = set(available)
+        self.checks = 0
+
+        def in_state(state, feature):
+            self.checks += 1
+            return feature in self.available
+
+        self.features = SimpleNamespace(in_state=in_state)
+
+
+class TestIsFeatureAvailable:
+    """Tests pour is_feature_available."""
+
+    def test_static_feature_memoized(self):
+        """Bouton de telecommande : une seule verification par connexion."""
+        atv = FakeAppleTV({FeatureName.Up})
+
+        assert is_feature_available(atv, FeatureName.Up)
+        assert is_feature_available(atv, FeatureName.Up)
+        assert atv.checks == 1
+
+    def test_state_dependent_feature_not_memoized(self):
+        """Lecture : la disponibilite suit l'etat de l'appareil."""
+        atv = FakeAppleTV({FeatureName.PlayPause})
+
+        assert is_feature_available(atv, FeatureName.PlayPause)
+        atv.available.clear()
+        assert not is_feature_available(atv, FeatureName.PlayPause)
+
+
+class TestApplyCredentials:
+    """Tests pour apply_credentials avec des credentials deja charges."""
+
+    def test_uses_preloaded_credentials(self):
+        """Les credentials fournis sont appliques sans lire le fichier."""
+        service = SimpleNamespace(protocol=SimpleNamespace(name="Companion"), credentials=None)
+        device = SimpleNamespace(identifier="ABC", services=[service])
+
+        assert apply_credentials(device, {"ABC": {"Companion": "secret"}})
+        assert service.credentials == "secret"
+
+    def test_unknown_device(self):
+        """Aucun credential pour cet appareil."""
+        device = SimpleNamespace(identifier="XYZ", services=[])
+
+        assert not apply_credentials(device, {"ABC": {"Companion": "secret"}})
+
+
+class TestCredentialsSession:
+    """Tests pour credentials_session."""
+
+    @pytest.fixture
+    def creds_file(self, tmp_path, monkeypatch):
+        """Redirige credentials.json vers un fichier temporaire."""
+        path = tmp_path / "credentials.json"
+        monkeypatch.setattr(connection, "CREDENTIALS_FILE", path)
+        return path
+
+    def test_single_write_for_batch(self, creds_file, monkeypatch):
+        """Plusieurs protocoles sont ecrits en une seule fois."""
+        writes = []
+        original_save = connection.save_json
+
+        def counting_save(*args, **kwargs):
+            writes.append(args)
+            return original_save(*args, **kwargs)
+
+        monkeypatch.setattr(connection, "save_json", counting_save)
+
+        with credentials_session() as batch:
+            save_credentials("ABC", "Companion", "c1", batch)
+            save_credentials("ABC", "AirPlay", "a1", batch)
+
+        assert len(writes) == 1
+        assert json.loads(creds_file.read_text()) == {"ABC": {"Companion": "c1", "AirPlay": "a1"}}
+
+    def test_no_write_when_unchanged(self, creds_file):
+        """Aucune ecriture si rien n'a ete ajoute."""
+        with credentials_session():
+            pass
+
+        assert not creds_file.exists()
+
+
+class TestKnownDevices:
+    """Tests pour remember_device et scan_known_devices."""
+
+    @pytest.fixture
+    def scans(self, tmp_path, monkeypatch):
+        """Fichiers d'appareils temporaires et scan pyatv simule."""
+        scans = []
+
+        async def fake_scan(loop, timeout=5, identifier=None, hosts=None):
+            scans.append({"identifier": identifier, "hosts": hosts})
+            return [make_device("Salon")]
+
+        monkeypatch.setattr(connection, "LAST_DEVICE_FILE", tmp_path / "last_device.json")
+        monkeypatch.setattr(connection, "KNOWN_DEVICES_FILE", tmp_path / "devices.json")
+        monkeypatch.setattr(connection.pyatv, "scan", fake_scan)
+        return scans
+
+    async def test_unknown_name_does_not_scan(self, scans):
+        """Aucun appareil memorise : pas de scan unicast."""
+        assert await scan_known_devices("Salon") == []
+        assert scans == []
+
+    async def test_remembered_devices_are_scanned_by_host(self, scans):
+        """Chaque appareil utilise est retrouve par son adresse."""
+        remember_device(make_device("Salon", "10.0.0.1", "A"))
+        remember_device(make_device("Chambre", "10.0.0.2", "B"))
+
+        devices = await scan_known_devices("salon")
+
+        assert [d.name for d in devices] == ["Salon"]
+        assert scans == [{"identifier": "A", "hosts": ["10.0.0.1"]}]
+
+    async def test_first_answer_wins(self, scans, monkeypatch):
+        """Plusieurs adresses pour ce nom : la premiere reponse suffit."""
+        async def slow_or_fast_scan(loop, timeout=5, identifier=None, hosts=None):
+            if hosts == ["10.0.0.1"]:
+                await asyncio.sleep(10)  # adresse perimee
+            return [make_device("Salon", hosts[0], identifier)]
+
+        monkeypatch.setattr(connection.pyatv, "scan", slow_or_fast_scan)
+        remember_device(make_device("Salon", "10.0.0.1", "A"))
+        remember_device(make_device("Salon", "10.0.0.5", "B"))
+
+        devices = await asyncio.wait_for(scan_known_devices("Salon"), timeout=1)
+
+        assert [d.address for d in devices] == ["10.0.0.5"]
+
+    async def test_partial_name_needs_full_scan(self, scans):
+        """Une sous-chaine ne suffit pas : l'appareil exact est peut-etre inconnu."""
+        remember_device(make_device("Salon 2", "10.0.0.2", "B"))
+
+        assert await scan_known_devices("Salon") == []
+        assert scans == []
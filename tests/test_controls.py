@@ -0,0 +1,51 @@
+"""Tests pour apple_tv.controls (disponibilite des fonctionnalites)."""
+
+from types import SimpleNamespace
+
+import pytest
+from pyatv.const import FeatureName
+
+from apple_tv.controls import cmd_play, get_volume
+from apple_tv.exceptions import FeatureNotAvailableError
+
+
+class FakeAppleTV:
+    """Faux AppleTV dont les fonctionnalites disponibles peuvent changer."""
+
+    def __init__(self, available):
+        async def play():
+            self.calls.append("play")
+
+        async def play_pause():
+            self.calls.append("play_pause")
+
+        self.available = set(available)
+        self.calls = []
+        self.features = SimpleNamespace(
+            in_state=lambda state, feature: feature in self.available
+        )
+        self.remote_control = SimpleNamespace(play=play, play_pause=play_pause)
+        self.audio = SimpleNamespace(volume=40.0)
+
+
+class TestStateDependentFeatures:
+    """La disponibilite liee a l'etat est relue a chaque commande."""
+
+    async def test_play_follows_state_change(self):
+        """Play devient disponible sur une connexion deja utilisee."""
+        atv = FakeAppleTV({FeatureName.PlayPause})
+
+        await cmd_play(atv)
+        atv.available.add(FeatureName.Play)
+        await cmd_play(atv)
+
+        assert atv.calls == ["play_pause", "play"]
+
+    async def test_volume_becomes_unavailable(self):
+        """Volume indisponible apres un changement de sortie audio."""
+        atv = FakeAppleTV({FeatureName.Volume})
+
+        assert await get_volume(atv) == 40.0
+        atv.available.clear()
+        with pytest.raises(FeatureNotAvailableError):
+            await get_volume(atv)
@@ -0,0 +1,201 @@
+"""Tests pour apple_tv.daemon (commandes et socket Unix)."""
+
+import asyncio
+import logging
+import socket
+import stat
+from types import SimpleNamespace
+
+import pytest
+
+from apple_tv import daemon
+from apple_tv.config import logger
+from apple_tv.daemon import DEVICE_COMMANDS, execute_command, run_daemon, send_command
+from apple_tv.exceptions import AppleTVError
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """Chemin de socket dans un repertoire temporaire."""
+    return tmp_path / "atv.sock"
+
+
+@pytest.fixture
+async def running_daemon(socket_path, monkeypatch, caplog):
+    """Daemon connecte a un faux appareil, commandes simulees.
+
+    executed contient les commandes executees, opened les connexions ouvertes.
+    """
+    executed = SimpleNamespace(commands=[], opened=[])
+
+    async def fake_open(device_config):
+        atv = SimpleNamespace(listener=None)
+        executed.opened.append(atv)
+        return atv
+
+    async def fake_execute(atv, command, params):
+        executed.commands.append((command, params))
+        logger.info(f"{command} ok")
+
+    monkeypatch.setattr(daemon, "open_atv", fake_open)
+    monkeypatch.setattr(daemon, "close_atv", lambda atv: None)
+    monkeypatch.setattr(daemon, "execute_command", fake_execute)
+    caplog.set_level(logging.INFO, logger="apple_tv")
+
+    task = asyncio.create_task(run_daemon(SimpleNamespace(name="Salon"), socket_path))
+    while not socket_path.exists():
+        await asyncio.sleep(0.01)
+
+    yield executed
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+class TestDaemon:
+    """Tests du daemon et du client."""
+
+    async def test_no_daemon(self, socket_path):
+        """Sans daemon, le client retourne None."""
+        assert await send_command("up", {}, socket_path) is None
+
+    async def test_command_forwarded(self, running_daemon, socket_path):
+        """La commande est executee par le daemon et sa sortie renvoyee."""
+        response = await send_command("volume", {"level": 30}, socket_path)
+
+        assert response == {"ok": True, "output": ["volume ok"]}
+        assert running_daemon.commands == [("volume", {"level": 30})]
+
+    async def test_unknown_command(self, running_daemon, socket_path):
+        """Une commande inconnue est refusee."""
+        response = await send_command("dance", {}, socket_path)
+
+        assert response["ok"] is False
+        assert running_daemon.commands == []
+
+    async def test_reconnect_after_connection_lost(self, running_daemon, socket_path):
+        """Connexion perdue : rouverte a la commande suivante."""
+        first = running_daemon.opened[0]
+        first.listener.connection_lost(ConnectionError("reset"))
+
+        response = await send_command("up", {}, socket_path)
+
+        assert response["ok"] is True
+        assert len(running_daemon.opened) == 2
+
+    async def test_stale_listener_ignored(self, running_daemon, socket_path):
+        """La fermeture d'une ancienne connexion n'oublie pas la nouvelle."""
+        first = running_daemon.opened[0]
+        first.listener.connection_lost(ConnectionError("reset"))
+        await send_command("up", {}, socket_path)
+
+        first.listener.connection_closed()
+        await send_command("up", {}, socket_path)
+
+        assert len(running_daemon.opened) == 2
+
+    async def test_socket_is_private(self, running_daemon, socket_path):
+        """La socket n'est accessible qu'a son proprietaire."""
+        assert stat.S_IMODE(socket_path.stat().st_mode) & 0o077 == 0
+
+    async def test_refuses_second_daemon(self, running_daemon, socket_path):
+        """Un daemon deja lance n'est pas coupe par un second."""
+        with pytest.raises(AppleTVError):
+            await run_daemon(SimpleNamespace(name="Salon"), socket_path)
+
+        assert socket_path.exists()
+        assert (await send_command("up", {}, socket_path))["ok"] is True
+
+    async def test_stale_socket_replaced(self, socket_path, monkeypatch):
+        """Une socket orpheline est remplacee au demarrage."""
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        async def fake_open(device_config):
+            return SimpleNamespace(listener=None)
+
+        monkeypatch.setattr(daemon, "open_atv", fake_open)
+        monkeypatch.setattr(daemon, "close_atv", lambda atv: None)
+
+        task = asyncio.create_task(run_daemon(SimpleNamespace(name="Salon"), socket_path))
+        try:
+            while not await daemon._daemon_running(socket_path):
+                assert not task.done()
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    async def test_no_unix_sockets(self, socket_path, monkeypatch):
+        """Plateforme sans sockets Unix : pas de daemon."""
+        monkeypatch.setattr(daemon, "_UNIX_SOCKETS", False)
+        assert await send_command("up", {}, socket_path) is None
+
+    async def test_daemon_dropped_during_command(self, socket_path):
+        """Daemon arrete pendant la commande : erreur, pas de None."""
+        async def drop(reader, writer):
+            await reader.readline()
+            writer.close()
+
+        server = await asyncio.start_unix_server(drop, path=str(socket_path))
+        async with server:
+            response = await send_command("up", {}, socket_path)
+
+        assert response["ok"] is False
+
+
+class FakeAppleTV:
+    """Connexion simulee enregistrant les appels de telecommande et de volume."""
+
+    def __init__(self):
+        self.calls = []
+
+        def recorder(name):
+            async def call(*args):
+                self.calls.append((name, *args))
+            return call
+
+        buttons = ("up", "down", "left", "right", "select", "menu", "home", "play_pause")
+        self.remote_control = SimpleNamespace(**{name: recorder(name) for name in buttons})
+        self.audio = SimpleNamespace(set_volume=recorder("set_volume"))
+        self.features = SimpleNamespace(in_state=lambda state, feature: True)
+
+
+class TestExecuteCommand:
+    """Tests pour execute_command."""
+
+    async def test_button(self):
+        """Les boutons passent par press_button."""
+        atv = FakeAppleTV()
+        await execute_command(atv, "up", {})
+        assert atv.calls == [("up",)]
+
+    async def test_simple_command(self):
+        """Commande sans argument."""
+        atv = FakeAppleTV()
+        await execute_command(atv, "play_pause", {})
+        assert atv.calls == [("play_pause",)]
+
+    async def test_command_with_argument(self):
+        """Le niveau de volume est lu dans les parametres."""
+        atv = FakeAppleTV()
+        await execute_command(atv, "volume", {"level": 30})
+        assert atv.calls == [("set_volume", 30)]
+
+    async def test_unknown_command(self):
+        """Une commande inconnue est refusee."""
+        assert "reboot" not in DEVICE_COMMANDS
+        with pytest.raises(ValueError):
+            await execute_command(FakeAppleTV(), "reboot", {})
+
+    async def test_failed_scenario(self, monkeypatch):
+        """Un scenario echoue est signale au client."""
+        async def fake_run(atv, name):
+            return False
+
+        monkeypatch.setattr(daemon, "run_scenario", fake_run)
+        with pytest.raises(AppleTVError):
+            await execute_command(FakeAppleTV(), "scenario", {"name": "soir"})
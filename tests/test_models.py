@@ -1,5 +1,7 @@
 """Tests pour apple_tv.models (validation)."""
 
+import sys
+
 import pytest
 
 from apple_tv.models import (
@@ -98,6 +100,52 @@ class TestScenarioStep:
 
         assert step.delay == 0
 
+    def test_negative_inter_delay_raises(self):
+        """inter_delay negatif leve ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            ScenarioStep(action="down", repeat=3, inter_delay=-0.1)
+
+        assert "inter_delay" in str(exc_info.value)
+
+    def test_non_bool_burst_raises(self):
+        """burst doit etre un booleen ("false" serait vrai)."""
+        with pytest.raises(ValidationError) as exc_info:
+            ScenarioStep.from_dict({"action": "down", "burst": "false"})
+
+        assert "burst" in str(exc_info.value)
+
+    def test_burst_with_pipeline_raises(self):
+        """burst et pipeline ne peuvent pas etre combines."""
+        with pytest.raises(ValidationError) as exc_info:
+            ScenarioStep.from_dict({"action": "down", "burst": True, "pipeline": False})
+
+        assert "incompatibles" in str(exc_info.value)
+
+    def test_non_bool_pipeline_raises(self):
+        """pipeline doit etre un booleen ("false" serait vrai)."""
+        with pytest.raises(ValidationError) as exc_info:
+            ScenarioStep.from_dict({"action": "down", "pipeline": "false"})
+
+        assert "pipeline" in str(exc_info.value)
+
+    def test_burst_from_dict(self):
+        """inter_delay et burst sont lus depuis le dictionnaire."""
+        step = ScenarioStep.from_dict(
+            {"action": "down", "repeat": 10, "inter_delay": 0.05, "burst": True}
+        )
+
+        assert step.inter_delay == 0.05
+        assert step.burst is True
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True requiert Python 3.10")
+    def test_no_instance_dict(self):
+        """Les etapes utilisent __slots__ (pas de __dict__ par instance)."""
+        step = ScenarioStep(action="up")
+
+        assert not hasattr(step, "__dict__")
+        with pytest.raises(AttributeError):
+            step.unknown = 1
+
     def test_from_dict(self):
         """Creation depuis un dictionnaire."""
         data = {"action": "down", "repeat": 2}
@@ -214,6 +262,13 @@ class TestValidateScheduleEntry:
         # Ne doit pas lever d'exception
         validate_schedule_entry(entry, 0)
 
+    def test_non_dict_entry_raises(self):
+        """Entree qui n'est pas un objet leve ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_schedule_entry(["Salon"], 0)
+
+        assert "objet" in str(exc_info.value)
+
     def test_missing_scenario_raises(self):
         """Scenario manquant leve ValidationError."""
         entry = {"device": "Salon", "time": {"hour": 10}}
@@ -0,0 +1,190 @@
+"""Tests pour apple_tv.scenarios (chargement et execution des etapes)."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from apple_tv.config import DEFAULT_SCENARIOS
+from apple_tv.models import Scenario, ScenarioStep, validate_scenarios
+from apple_tv import scenarios as scenarios_module
+from apple_tv.scenarios import execute_step, load_scenarios, load_validated_scenarios
+
+
+class FakeRemote:
+    """Telecommande qui enregistre les appuis."""
+
+    def __init__(self):
+        self.presses = []
+
+    def __getattr__(self, name):
+        async def press():
+            self.presses.append(name)
+
+        return press
+
+
+class FakeAppleTV:
+    """Faux AppleTV avec une telecommande et un ecran tactile."""
+
+    def __init__(self):
+        async def swipe(*gesture):
+            pass
+
+        self.remote_control = FakeRemote()
+        self.touch = SimpleNamespace(swipe=swipe)
+
+
+@pytest.fixture
+def atv():
+    """Faux AppleTV pour les tests."""
+    return FakeAppleTV()
+
+
+class TestExecuteStep:
+    """Tests pour execute_step."""
+
+    async def test_repeat_presses(self, atv):
+        """Chaque repetition envoie un appui."""
+        step = ScenarioStep(action="select", repeat=3, delay=0, inter_delay=0)
+
+        assert await execute_step(atv, step, 1)
+        assert atv.remote_control.presses == ["select"] * 3
+
+    async def test_pipelined_presses(self, atv):
+        """Les fleches repetees sont toutes envoyees."""
+        step = ScenarioStep(action="down", repeat=4, delay=0, inter_delay=0)
+
+        assert await execute_step(atv, step, 1)
+        assert atv.remote_control.presses == ["down"] * 4
+
+    async def test_burst(self, atv):
+        """En rafale, toutes les repetitions sont envoyees."""
+        step = ScenarioStep(action="down", repeat=5, delay=0, burst=True)
+
+        assert await execute_step(atv, step, 1)
+        assert atv.remote_control.presses == ["down"] * 5
+
+    @pytest.mark.parametrize(
+        ("action", "pipeline", "expected"),
+        [("down", None, True), ("select", None, False), ("select", True, True), ("down", False, False)],
+    )
+    async def test_pipeline_flag(self, atv, monkeypatch, action, pipeline, expected):
+        """Le pipelining suit le flag de l'etape, fleches par defaut."""
+        pipelined = []
+
+        async def fake_pipeline(action_fn, label, num, repeat, inter_delay):
+            pipelined.append(label)
+
+        monkeypatch.setattr(scenarios_module, "_pipeline_presses", fake_pipeline)
+        step = ScenarioStep(action=action, repeat=2, delay=0, inter_delay=0, pipeline=pipeline)
+
+        assert await execute_step(atv, step, 1)
+        assert bool(pipelined) is expected
+
+    async def test_launch_uses_apps_config(self, atv):
+        """launch resout l'alias et lance le bundle ID."""
+        launched = []
+
+        async def launch_app(bundle_id):
+            launched.append(bundle_id)
+
+        atv.features = SimpleNamespace(in_state=lambda state, feature: True)
+        atv.apps = SimpleNamespace(launch_app=launch_app)
+        step = ScenarioStep(action="launch", app="Netflix")
+
+        assert await execute_step(atv, step, 1, apps_config={"netflix": "com.netflix.Netflix"})
+        assert launched == ["com.netflix.Netflix"]
+
+    async def test_sub_scenario(self, atv):
+        """Les etapes du sous-scenario sont executees."""
+        scenarios = {
+            "nav": Scenario(
+                name="nav",
+                steps=[ScenarioStep(action="up", delay=0), ScenarioStep(action="select", delay=0)],
+            )
+        }
+        step = ScenarioStep(action="scenario", name="nav")
+
+        assert await execute_step(atv, step, 1, scenarios)
+        assert atv.remote_control.presses == ["up", "select"]
+
+    async def test_unknown_sub_scenario(self, atv):
+        """Un sous-scenario absent fait echouer l'etape."""
+        step = ScenarioStep(action="scenario", name="absent")
+
+        assert not await execute_step(atv, step, 1, {})
+
+
+class TestLoadScenarios:
+    """Tests pour load_scenarios."""
+
+    def test_missing_file_returns_defaults_without_writing(self, tmp_path, monkeypatch):
+        """Sans scenarios.json : scenarios par defaut, aucun fichier cree."""
+        path = tmp_path / "scenarios.json"
+        monkeypatch.setattr(scenarios_module, "SCENARIOS_FILE", path)
+
+        scenarios = load_scenarios()
+        name = next(iter(scenarios))
+        scenarios[name]["steps"].clear()
+
+        assert not path.exists()
+        assert DEFAULT_SCENARIOS[name]["steps"]
+
+    def test_does_not_import_pyatv(self):
+        """Lister les scenarios ne charge pas pyatv (interpreteur neuf)."""
+        code = (
+            "import sys\n"
+            "from apple_tv.scenarios import load_scenarios\n"
+            "load_scenarios()\n"
+            "assert 'pyatv' not in sys.modules, 'pyatv importe'\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+
+class TestLoadValidatedScenarios:
+    """Tests pour load_validated_scenarios (cache par version du fichier)."""
+
+    @pytest.fixture
+    def path(self, tmp_path, monkeypatch):
+        """scenarios.json temporaire, cache vide."""
+        path = tmp_path / "scenarios.json"
+        path.write_text(json.dumps({"nav": {"steps": [{"action": "up"}]}}))
+        monkeypatch.setattr(scenarios_module, "SCENARIOS_FILE", path)
+        monkeypatch.setattr(scenarios_module, "_validated_cache", {})
+        return path
+
+    def test_validated_once_per_file_version(self, path, monkeypatch):
+        """Fichier inchange : pas de nouvelle validation."""
+        calls = []
+
+        def counting_validate(data):
+            calls.append(data)
+            return validate_scenarios(data)
+
+        monkeypatch.setattr(scenarios_module, "validate_scenarios", counting_validate)
+
+        first = load_validated_scenarios()
+        load_scenarios()
+
+        assert load_validated_scenarios() is first
+        assert len(calls) == 1
+
+    def test_file_change_invalidates(self, path):
+        """Fichier modifie : les nouveaux scenarios sont valides et retournes."""
+        load_validated_scenarios()
+        path.write_text(json.dumps({"menu": {"steps": [{"action": "menu"}, {"action": "home"}]}}))
+        os.utime(path, ns=(0, 0))
+
+        assert list(load_validated_scenarios()) == ["menu"]
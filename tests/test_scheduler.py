@@ -0,0 +1,312 @@
+"""Tests pour apple_tv.scheduler."""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pyatv.exceptions import ConnectionLostError
+
+from apple_tv import scheduler
+from apple_tv.scheduler import ScheduleEntry, time_keys
+
+
+def make_entry(hour=20, minute=0, weekdays=None):
+    """Cree une planification de test."""
+    return ScheduleEntry(scenario="test", device="Salon", hour=hour, minute=minute, weekdays=weekdays)
+
+
+class TestNextFire:
+    """Tests pour ScheduleEntry.next_fire."""
+
+    # Mercredi 15 janvier 2025
+    WEDNESDAY = datetime(2025, 1, 15, 12, 0)
+
+    def test_later_today(self):
+        """Heure pas encore passee : aujourd'hui."""
+        assert make_entry(20, 30).next_fire(self.WEDNESDAY) == datetime(2025, 1, 15, 20, 30)
+
+    def test_already_passed_is_tomorrow(self):
+        """Heure passee : demain."""
+        assert make_entry(8, 0).next_fire(self.WEDNESDAY) == datetime(2025, 1, 16, 8, 0)
+
+    def test_same_minute_is_included(self):
+        """La minute de depart est incluse."""
+        assert make_entry(12, 0).next_fire(self.WEDNESDAY) == self.WEDNESDAY
+
+    def test_weekdays_skip_to_next_allowed_day(self):
+        """Seuls les jours autorises sont retenus (0=dimanche)."""
+        entry = make_entry(20, 0, weekdays=[0, 6])
+
+        assert entry.next_fire(self.WEDNESDAY) == datetime(2025, 1, 18, 20, 0)
+
+    def test_weekday_today(self):
+        """Le jour courant est retenu s'il est autorise."""
+        entry = make_entry(20, 0, weekdays=[3])
+
+        assert entry.next_fire(self.WEDNESDAY) == datetime(2025, 1, 15, 20, 0)
+
+
+class TestShouldRunNow:
+    """Tests pour ScheduleEntry.should_run_now."""
+
+    def test_time_keys(self):
+        """Minute du jour et jour de la semaine (dimanche=0)."""
+        assert time_keys(datetime(2025, 1, 19, 20, 30)) == (20 * 60 + 30, 0)
+
+    def test_matching_minute(self):
+        """Meme minute, tous les jours."""
+        assert make_entry(20, 30).should_run_now(20 * 60 + 30, 3)
+
+    def test_other_minute(self):
+        """Minute differente."""
+        assert not make_entry(20, 30).should_run_now(20 * 60 + 31, 3)
+
+    def test_day_not_allowed(self):
+        """Jour exclu."""
+        assert not make_entry(20, 30, weekdays=[1, 2]).should_run_now(20 * 60 + 30, 3)
+
+    def test_day_allowed(self):
+        """Jour autorise, y compris dimanche (bit 0) et samedi (bit 6)."""
+        entry = make_entry(20, 30, weekdays=[0, 6])
+        assert entry.should_run_now(20 * 60 + 30, 0)
+        assert entry.should_run_now(20 * 60 + 30, 6)
+
+    def test_empty_weekdays_never_runs(self):
+        """Liste de jours vide : jamais."""
+        assert not make_entry(20, 30, weekdays=[]).should_run_now(20 * 60 + 30, 3)
+
+
+async def run_due(*batches):
+    """Depose les planifications comme la boucle du scheduler et attend leur fin."""
+    workers = scheduler._DeviceWorkers()
+    try:
+        for entries in batches:
+            await workers.submit(entries)
+            await asyncio.wait_for(workers.join(), timeout=1)
+    finally:
+        await workers.close()
+
+
+class TestRunDeviceGroups:
+    """Tests pour l'execution des planifications par appareil."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        """Scan, connexion et execution simules."""
+        calls = {"scan": 0, "connect": [], "run": [], "cleared": []}
+
+        async def fake_scan(timeout=5, *, identifier=None, name=None):
+            calls["scan"] += 1
+            return [
+                SimpleNamespace(name="Salon", address="10.0.0.1", identifier="A"),
+                SimpleNamespace(name="Chambre", address="10.0.0.2", identifier="B"),
+            ]
+
+        async def fake_open(device):
+            calls["connect"].append(device.name)
+            return SimpleNamespace(name=device.name, listener=None)
+
+        async def fake_run(atv, name):
+            calls["run"].append((atv.name, name))
+            return True
+
+        monkeypatch.setattr(scheduler, "_last_scan", None)
+        monkeypatch.setattr(scheduler, "_connections", {})
+        async def no_known_devices(name):
+            return []
+
+        monkeypatch.setattr(scheduler, "scan_devices", fake_scan)
+        monkeypatch.setattr(scheduler, "scan_known_devices", no_known_devices)
+        monkeypatch.setattr(scheduler, "open_atv", fake_open)
+        monkeypatch.setattr(scheduler, "close_atv", lambda atv: None)
+        monkeypatch.setattr(scheduler, "run_scenario", fake_run)
+        monkeypatch.setattr(scheduler, "clear_feature_cache", calls["cleared"].append)
+        monkeypatch.setattr(scheduler, "clear_app_list", calls["cleared"].append)
+        return calls
+
+    async def test_one_scan_and_one_connection_per_device(self, calls):
+        """Les planifications d'un meme appareil partagent scan et connexion."""
+        entries = [
+            ScheduleEntry(scenario="a", device="Salon", hour=20, minute=0),
+            ScheduleEntry(scenario="b", device="salon", hour=20, minute=0),
+            ScheduleEntry(scenario="c", device="Chambre", hour=20, minute=0),
+        ]
+        await run_due(entries)
+
+        assert calls["scan"] == 1
+        assert calls["connect"] == ["Salon", "Chambre"]
+        assert calls["run"] == [("Salon", "a"), ("Salon", "b"), ("Chambre", "c")]
+
+    async def test_connection_reused_across_runs(self, calls):
+        """Une execution suivante reutilise la connexion sans scanner."""
+        entry = ScheduleEntry(scenario="a", device="Salon", hour=20, minute=0)
+
+        await run_due([entry], [entry])
+
+        assert calls["scan"] == 1
+        assert calls["connect"] == ["Salon"]
+        assert len(calls["run"]) == 2
+
+    async def test_caches_cleared_on_reuse(self, calls):
+        """Connexion reutilisee : fonctionnalites et apps sont relues."""
+        entry = ScheduleEntry(scenario="a", device="Salon", hour=20, minute=0)
+
+        await run_due([entry])
+        assert calls["cleared"] == []
+
+        await run_due([entry])
+        atv = scheduler._connections["salon"]
+        assert calls["cleared"] == [atv, atv]
+
+    async def test_stale_listener_keeps_new_connection(self, calls):
+        """La fermeture d'une ancienne connexion ne retire pas la nouvelle."""
+        entry = ScheduleEntry(scenario="a", device="Salon", hour=20, minute=0)
+        await run_due([entry])
+        old = scheduler._connections["salon"]
+
+        old.listener.connection_lost(ConnectionLostError("perdue"))
+        await run_due([entry])
+        new = scheduler._connections["salon"]
+        old.listener.connection_closed()
+
+        assert new is not old
+        assert scheduler._connections["salon"] is new
+
+    async def test_known_devices_skip_multicast_scan(self, calls, monkeypatch):
+        """Appareils deja utilises : scans unicast, sans scan complet."""
+
+        async def known(name):
+            return [SimpleNamespace(name=name, address="10.0.0.9", identifier=name)]
+
+        monkeypatch.setattr(scheduler, "scan_known_devices", known)
+        entries = [
+            ScheduleEntry(scenario="a", device="Salon", hour=20, minute=0),
+            ScheduleEntry(scenario="c", device="Chambre", hour=20, minute=0),
+        ]
+        await run_due(entries)
+
+        assert calls["scan"] == 0
+        assert sorted(calls["connect"]) == ["Chambre", "Salon"]
+
+    async def test_reconnect_once_on_connection_error(self, calls, monkeypatch):
+        """Une connexion perdue est rouverte et le scenario relance."""
+        failures = [ConnectionLostError("perdue")]
+
+        async def flaky_run(atv, name):
+            if failures:
+                raise failures.pop()
+            calls["run"].append((atv.name, name))
+            return True
+
+        monkeypatch.setattr(scheduler, "run_scenario", flaky_run)
+        entry = ScheduleEntry(scenario="a", device="Salon", hour=20, minute=0)
+
+        await run_due([entry])
+
+        assert calls["connect"] == ["Salon", "Salon"]
+        assert calls["run"] == [("Salon", "a")]
+
+    async def test_devices_run_concurrently(self, calls, monkeypatch):
+        """Un scenario long sur un appareil ne bloque pas les autres."""
+        release = asyncio.Event()
+
+        async def slow_run(atv, name):
+            if atv.name == "Salon":
+                await release.wait()
+            calls["run"].append((atv.name, name))
+            if atv.name == "Chambre":
+                release.set()
+            return True
+
+        monkeypatch.setattr(scheduler, "run_scenario", slow_run)
+        entries = [
+            ScheduleEntry(scenario="a", device="Salon", hour=20, minute=0),
+            ScheduleEntry(scenario="b", device="Chambre", hour=20, minute=0),
+        ]
+
+        await run_due(entries)
+
+        assert calls["run"] == [("Chambre", "b"), ("Salon", "a")]
+
+
+class TestDeviceWorkers:
+    """Tests pour les files par appareil du scheduler."""
+
+    async def test_submit_keeps_order_per_device(self, monkeypatch):
+        """Les depots d'un meme appareil s'executent dans l'ordre."""
+        runs = []
+
+        async def fake_prepare(entries):
+            by_device = {}
+            for entry in entries:
+                by_device.setdefault(entry.device.casefold(), []).append(entry)
+            return by_device, []
+
+        async def fake_group(key, group, devices):
+            await asyncio.sleep(0)
+            runs.extend((key, e.scenario) for e in group)
+
+        monkeypatch.setattr(scheduler, "_prepare_group", fake_prepare)
+        monkeypatch.setattr(scheduler, "_run_device_group", fake_group)
+
+        workers = scheduler._DeviceWorkers()
+        try:
+            await workers.submit([ScheduleEntry(scenario="a", device="Salon", hour=20, minute=0)])
+            await workers.submit([ScheduleEntry(scenario="b", device="Salon", hour=20, minute=1)])
+            await asyncio.wait_for(workers.join(), timeout=1)
+        finally:
+            await workers.close()
+
+        assert runs == [("salon", "a"), ("salon", "b")]
+
+
+class TestWarmUpScan:
+    """Tests pour le scan initial du scheduler."""
+
+    async def test_primes_scan_cache(self, monkeypatch):
+        """Le scan initial sert aux premieres echeances."""
+        names = []
+
+        async def fake_scan(timeout=5, *, identifier=None, name=None):
+            names.append(name)
+            return []
+
+        monkeypatch.setattr(scheduler, "_last_scan", None)
+        monkeypatch.setattr(scheduler, "scan_devices", fake_scan)
+
+        await scheduler._warm_up_scan()
+        await scheduler._scan_for_schedules(["Salon"])
+
+        assert names == [None]
+
+    async def test_partial_scan_not_cached(self, monkeypatch):
+        """Un scan limite a un appareil n'est pas reutilise pour les autres."""
+        names = []
+
+        async def fake_scan(timeout=5, *, identifier=None, name=None):
+            names.append(name)
+            return []
+
+        async def no_known_devices(name):
+            return []
+
+        monkeypatch.setattr(scheduler, "_last_scan", None)
+        monkeypatch.setattr(scheduler, "scan_devices", fake_scan)
+        monkeypatch.setattr(scheduler, "scan_known_devices", no_known_devices)
+
+        await scheduler._scan_for_schedules(["Salon"])
+        await scheduler._scan_for_schedules(["Chambre"])
+
+        assert names == ["Salon", "Chambre"]
+
+    async def test_errors_are_logged(self, monkeypatch):
+        """Une erreur de scan n'arrete pas le scheduler."""
+
+        async def failing_scan(timeout=5, *, identifier=None, name=None):
+            raise OSError("reseau")
+
+        monkeypatch.setattr(scheduler, "_last_scan", None)
+        monkeypatch.setattr(scheduler, "scan_devices", failing_scan)
+
+        await scheduler._warm_up_scan()